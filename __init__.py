@@ -2,7 +2,7 @@ from research_service import ResearchService
 from graph_crawler import GraphWebCrawler, PageInfo, GraphNode
 from llm_service import LLMService, AnalysisResult
 from search_engine import SearchEngine
-from selenium_utils import WebDriverManager, create_driver_manager
+from selenium_utils import WebDriverManager, SeleniumPool, create_driver_manager
 
 __all__ = [
     'ResearchService',
@@ -13,5 +13,6 @@ __all__ = [
     'AnalysisResult',
     'SearchEngine',
     'WebDriverManager',
+    'SeleniumPool',
     'create_driver_manager'
 ]
@@ -0,0 +1,214 @@
+"""
+Caching utilities shared by the search and research services
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+def _serialize(payload: Any) -> bytes:
+    """Serialize a payload to canonical (sorted-key) JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(payload, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def make_cache_key(payload: Any) -> str:
+    """Build a short, stable cache key for a JSON-serializable payload"""
+    return hashlib.blake2b(_serialize(payload), digest_size=16).hexdigest()
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class TTLLRUCache:
+    """Thread-safe in-memory LRU cache whose entries also expire after a TTL"""
+    
+    def __init__(self, maxsize: int = 128, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if time.monotonic() < expires_at:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+    
+    def set(self, key: Any, value: Any):
+        """Store value under key, evicting the least recently used entry if full"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self):
+        """Drop all entries and reset hit/miss counters"""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def info(self) -> CacheInfo:
+        """Return hit/miss statistics in the style of functools.lru_cache"""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
+class SQLiteTTLCache:
+    """
+    Persistent key/value cache backed by SQLite (WAL mode), so entries survive
+    process restarts and can be shared by several worker processes.
+    Values must be JSON-serializable.
+    """
+    
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        return json.loads(row[0]) if row else default
+    
+    def set(self, key: str, value: Any, expire: float):
+        """Store value under key for expire seconds, pruning expired entries"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), now + expire)
+            )
+            self._conn.commit()
+    
+    def close(self):
+        """Close the underlying SQLite connection"""
+        with self._lock:
+            self._conn.close()
+
+
+def ttl_lru_cache(maxsize: int = 128, ttl: float = 3600, key: Optional[Callable[..., Any]] = None,
+                  cache_if: Optional[Callable[[Any], bool]] = None):
+    """
+    Memoize a function (sync or async) in a TTLLRUCache.
+    key builds the cache key from the call arguments; by default the positional
+    and keyword arguments themselves are used. cache_if, when given, decides from
+    the result whether it is stored (e.g. to skip degraded results). Async functions
+    cache their result, not the coroutine. The wrapper exposes cache_info() and cache_clear().
+    """
+    def decorator(func):
+        cache = TTLLRUCache(maxsize=maxsize, ttl=ttl)
+        missing = object()
+        
+        def make_key(args, kwargs):
+            if key is not None:
+                return key(*args, **kwargs)
+            return (args, tuple(sorted(kwargs.items())))
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                cache_key = make_key(args, kwargs)
+                value = cache.get(cache_key, missing)
+                if value is missing:
+                    value = await func(*args, **kwargs)
+                    if cache_if is None or cache_if(value):
+                        cache.set(cache_key, value)
+                return value
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                cache_key = make_key(args, kwargs)
+                value = cache.get(cache_key, missing)
+                if value is missing:
+                    value = func(*args, **kwargs)
+                    if cache_if is None or cache_if(value):
+                        cache.set(cache_key, value)
+                return value
+        
+        wrapper.cache = cache
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    
+    return decorator
+
+
+def coalesce_inflight(key: Callable[..., Any]):
+    """
+    Collapse concurrent calls of a coroutine function that share the same key into
+    one execution: the first caller runs it, later callers await the same result.
+    The in-flight registry uses concurrent.futures.Future, so callers running in
+    different threads (each with its own event loop) are coalesced too.
+    """
+    def decorator(func):
+        inflight: Dict[Any, concurrent.futures.Future] = {}
+        lock = threading.Lock()
+        
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            call_key = key(*args, **kwargs)
+            with lock:
+                future = inflight.get(call_key)
+                is_leader = future is None
+                if is_leader:
+                    future = concurrent.futures.Future()
+                    inflight[call_key] = future
+            
+            if not is_leader:
+                return await asyncio.wrap_future(future)
+            
+            try:
+                result = await func(*args, **kwargs)
+                future.set_result(result)
+                return result
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with lock:
+                    inflight.pop(call_key, None)
+        
+        return wrapper
+    
+    return decorator
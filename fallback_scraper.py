@@ -3,36 +3,98 @@ Fallback web scraper using requests when Selenium fails
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
+import functools
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from urllib.parse import urljoin, urlparse
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Elements whose text never counts as page content
+_NON_CONTENT_TAGS = ("script", "style", "nav", "footer", "header", "aside")
+
+
+def _class_xpath(name: str) -> str:
+    """XPath matching elements whose class list contains name (the CSS .name selector)"""
+    return f'//*[contains(concat(" ", normalize-space(@class), " "), " {name} ")]'
+
+
+# Main content areas in priority order (main, article, [role="main"], then common content classes)
+_CONTENT_XPATHS = (
+    '//main',
+    '//article',
+    '//*[@role="main"]',
+    *(_class_xpath(name) for name in ('content', 'main-content', 'article-body',
+                                      'post-content', 'entry-content', 'page-content')),
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_xpath(expr: str):
+    """Compile an XPath expression once and reuse it for every page"""
+    from lxml import etree
+    return etree.XPath(expr)
+
+
+def parse_html(body: bytes):
+    """Parse an HTML document with lxml's C parser; the encoding is sniffed from the bytes"""
+    from lxml import html as lxml_html
+    return lxml_html.fromstring(body)
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_session() -> requests.Session:
+    """One keep-alive session for every scraper in the process, so same-host fetches skip DNS + TLS"""
+    session = requests.Session()
+    
+    # Set headers to avoid blocking
+    user_agent = os.getenv('USER_AGENT', 
+        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+    
+    session.headers.update({
+        'User-Agent': user_agent,
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+    })
+    
+    # Per-host pools sized for the concurrent BFS fan-out, with a short backoff on connection errors
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 class FallbackScraper:
     """Simple requests-based scraper as fallback when Selenium fails"""
     
     def __init__(self, timeout: int = 10, delay: float = 1.0):
         self.timeout = timeout
         self.delay = delay
-        self.session = requests.Session()
+        self.session = _shared_session()
         self.logger = logging.getLogger(__name__)
-        
-        # Set headers to avoid blocking
-        user_agent = os.getenv('USER_AGENT', 
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-        
-        self.session.headers.update({
-            'User-Agent': user_agent,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        })
+    
+    def fetch_html(self, url: str) -> Optional[Tuple[str, str]]:
+        """Fetch raw HTML without parsing or delay. Returns (html, final_url) or None"""
+        try:
+            response = self.session.get(url, timeout=self.timeout, allow_redirects=True)
+            response.raise_for_status()
+            if 'html' not in response.headers.get('Content-Type', 'text/html'):
+                return None
+            return response.text, response.url
+        except requests.exceptions.RequestException as e:
+            self.logger.debug(f"Plain HTTP fetch failed for {url}: {e}")
+            return None
     
     def get_page_content(self, url: str) -> Optional[Dict[str, Any]]:
         """Get page content using requests"""
@@ -46,17 +108,17 @@ class FallbackScraper:
             response.raise_for_status()
             
             # Parse content
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = parse_html(response.content)
             
             # Extract title
-            title_tag = soup.find('title')
-            title = title_tag.get_text().strip() if title_tag else url
+            title_text = tree.findtext('.//title')
+            title = title_text.strip() if title_text is not None else url
             
             # Extract main content
-            content = self._extract_main_content(soup)
+            content = self._extract_main_content(tree)
             
             # Extract links
-            links = self._extract_links(soup, url)
+            links = self._extract_links(tree, url)
             
             if len(content) < 100:
                 self.logger.warning(f"⚠️  Minimal content extracted from {url}")
@@ -79,46 +141,44 @@ class FallbackScraper:
             self.logger.error(f"❌ Error scraping {url}: {e}")
             return None
     
-    def _extract_main_content(self, soup: BeautifulSoup) -> str:
+    def _extract_main_content(self, tree) -> str:
         """Extract main text content from page"""
-        # Remove script and style elements
-        for script in soup(["script", "style", "nav", "footer", "header", "aside"]):
-            script.decompose()
+        from lxml import etree
         
-        # Try to find main content areas
-        content_selectors = [
-            'main', 'article', '[role="main"]', 
-            '.content', '.main-content', '.article-body',
-            '.post-content', '.entry-content', '.page-content'
-        ]
+        # Remove script and style elements (and comments); drop_tree keeps the tail text, padded
+        # so it stays a separate word instead of gluing onto the text before the removed element
+        for element in list(tree.iter(etree.Comment, *_NON_CONTENT_TAGS)):
+            if element.getparent() is None:
+                continue
+            if element.tail:
+                element.tail = ' ' + element.tail
+            element.drop_tree()
         
+        # Try to find main content areas
         main_content = None
-        for selector in content_selectors:
-            main_content = soup.select_one(selector)
-            if main_content:
+        for xpath in _CONTENT_XPATHS:
+            matches = _compile_xpath(xpath)(tree)
+            if matches:
+                main_content = matches[0]
                 break
         
         # Fallback to body if no main content found
-        if not main_content:
-            main_content = soup.find('body')
+        if main_content is None:
+            main_content = tree.find('.//body')
         
-        if main_content:
-            # Get text and clean it
-            text = main_content.get_text(separator=' ', strip=True)
-            # Remove extra whitespace
-            text = ' '.join(text.split())
+        if main_content is not None:
+            # Get text and clean it; split() also removes extra whitespace
+            text = ' '.join(' '.join(main_content.itertext()).split())
             return text[:5000]  # Limit to 5000 characters
         
         return ""
     
-    def _extract_links(self, soup: BeautifulSoup, base_url: str) -> list:
+    def _extract_links(self, tree, base_url: str) -> list:
         """Extract links from page"""
         links = []
         base_domain = urlparse(base_url).netloc
         
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            
+        for href in _compile_xpath('//a/@href')(tree):
             # Convert relative URLs to absolute
             absolute_url = urljoin(base_url, href)
             
@@ -2,11 +2,13 @@ from selenium_utils import WebDriverManager
 from fallback_scraper import FallbackScraper
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
-from collections import deque, defaultdict
+from collections import Counter, deque, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import time
 import logging
 import os
-from typing import List, Dict, Set, Tuple, Optional
+from typing import List, Dict, Set, Tuple, Optional, Callable
 import validators
 from dataclasses import dataclass, field
 import re
@@ -16,6 +18,32 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Content extraction selectors, built once instead of on every page
+_NON_CONTENT_TAGS = ["script", "style", "nav", "footer", "header", "aside", "iframe", "noscript"]
+_NOISE_CLASS_RE = re.compile(r'(ad|advertisement|sidebar|navigation|menu|footer|header)', re.I)
+_CONTENT_TAGS = [
+    'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 
+    'article', 'main', 'section', 'div', 
+    'li', 'blockquote', 'pre', 'code'
+]
+_NOISE_PHRASES = (
+    'cookie', 'privacy policy', 'terms of service', 
+    'subscribe', 'newsletter', 'advertisement'
+)
+
+# Link filters applied to every extracted href
+_SKIP_LINK_EXTENSIONS = ('.pdf', '.jpg', '.jpeg', '.png', '.gif', '.zip', '.doc', '.docx', '.ppt', '.pptx')
+_SEARCH_URL_MARKERS = ('google.com/search', 'duckduckgo.com/?q=', 'bing.com/search')
+_MAX_LINKS_PER_PAGE = 15  # Increased link limit for better discovery
+
+# GraphNode.crawl_status encoded as small ints for the vectorized graph metrics
+_STATUS_CODES = {"pending": 0, "crawled": 1, "failed": 2}
+_OTHER_STATUS = len(_STATUS_CODES)
+
+# Without Selenium, BFS fetches this many frontier pages at once, at most _FALLBACK_PER_HOST per site
+_FALLBACK_BATCH_SIZE = 16
+_FALLBACK_PER_HOST = 4
+
 @dataclass
 class GraphNode:
     """Represents a node in the web graph with proper relationships"""
@@ -70,10 +98,23 @@ class GraphWebCrawler:
         self.graph_nodes: Dict[str, GraphNode] = {}
         self.url_to_node_id: Dict[str, str] = {}
         
-        # Selenium setup using WebDriverManager
-        self.driver_manager = WebDriverManager(headless=headless, timeout=timeout)
+        # Selenium setup using WebDriverManager; the crawler does its own HTTP-first tiering below
+        self.driver_manager = WebDriverManager(headless=headless, timeout=timeout, http_first=False)
         self.fallback_scraper = FallbackScraper(timeout=timeout, delay=delay)
-        self.selenium_available = self._setup_driver()
+        
+        # Try a plain HTTP fetch before Selenium; Chrome is only used for client-rendered pages
+        self.http_first = os.getenv('CRAWLER_HTTP_FIRST', 'true').lower() == 'true'
+        
+        # Chrome is started lazily by _ensure_driver, on the first page that actually needs it
+        self.selenium_available = os.getenv('CRAWLER_DISABLE_SELENIUM', 'false').lower() != 'true'
+        if not self.selenium_available:
+            self.logger.info("Selenium disabled via CRAWLER_DISABLE_SELENIUM, using fallback scraper")
+    
+    def _ensure_driver(self) -> bool:
+        """Start the WebDriver on first use; returns whether a live driver is available"""
+        if self.selenium_available and self.driver_manager.driver is None:
+            self.selenium_available = self._setup_driver()
+        return self.selenium_available and self.driver_manager.is_alive()
     
     def _setup_driver(self) -> bool:
         """Initialize Selenium WebDriver using WebDriverManager"""
@@ -125,11 +166,15 @@ class GraphWebCrawler:
     def _fetch_page_selenium(self, node: GraphNode) -> bool:
         """Fetch and parse a single page using Selenium or fallback scraper"""
         # Try Selenium first if available
-        if self.selenium_available and self.driver_manager and self.driver_manager.is_alive():
-            return self._fetch_with_selenium(node)
-        else:
-            # Use fallback scraper
-            return self._fetch_with_fallback(node)
+        if self.selenium_available and self.driver_manager:
+            # Most pages are server-rendered; a plain HTTP fetch avoids the Chrome page load
+            if self.http_first and self._fetch_with_http(node):
+                return True
+            if self._ensure_driver():
+                return self._fetch_with_selenium(node)
+        
+        # Use fallback scraper
+        return self._fetch_with_fallback(node)
     
     def _fetch_with_selenium(self, node: GraphNode) -> bool:
         """Fetch page using Selenium"""
@@ -137,7 +182,7 @@ class GraphWebCrawler:
             url = node.url
             
             # Skip search engine URLs themselves
-            if any(domain in url for domain in ['google.com/search', 'duckduckgo.com/?q=', 'bing.com/search']):
+            if any(domain in url for domain in _SEARCH_URL_MARKERS):
                 self.logger.warning(f"Skipping search engine URL: {url}")
                 node.crawl_status = "failed"
                 return False
@@ -159,32 +204,17 @@ class GraphWebCrawler:
             
             soup = BeautifulSoup(page_source, 'html.parser')
             
-            # Extract title
-            title_element = soup.find('title')
-            node.title = title_element.get_text(strip=True) if title_element else url
-            
             # Extract content
-            node.content = self._extract_content(soup)
+            content = self._extract_content(soup)
             
             # Skip pages with minimal content
-            if len(node.content.strip()) < 100:
+            if len(content.strip()) < 100:
                 self.logger.warning(f"Skipping page with minimal content: {url}")
                 node.crawl_status = "failed"
                 return False
             
-            # Extract links
-            node.outbound_links = self._extract_links(soup, url)
-            
-            # Update metadata
-            node.metadata = {
-                'content_length': len(node.content),
-                'links_count': len(node.outbound_links),
-                'title_length': len(node.title),
-                'final_url': self.driver_manager.get_current_url(),  # In case of redirects
-                'method': 'selenium'
-            }
-            
-            node.crawl_status = "crawled"
+            # In case of redirects
+            self._populate_node(node, soup, content, self.driver_manager.get_current_url(), 'selenium')
             return True
             
         except Exception as e:
@@ -192,6 +222,59 @@ class GraphWebCrawler:
             node.crawl_status = "failed"
             return False
     
+    def _fetch_with_http(self, node: GraphNode) -> bool:
+        """
+        Fetch page with a plain HTTP request and keep it only if it is server-rendered.
+        Returns False (leaving the node pending) so the caller can fall back to Selenium.
+        """
+        url = node.url
+        if any(domain in url for domain in _SEARCH_URL_MARKERS):
+            return False
+        
+        try:
+            result = self.fallback_scraper.fetch_html(url)
+            if not result:
+                return False
+            
+            html, final_url = result
+            soup = BeautifulSoup(html, 'html.parser')
+            content = self._extract_content(soup)
+            
+            # Client-rendered shells have little text until JavaScript runs
+            if len(content.strip()) < 500:
+                self.logger.debug(f"Page looks client-rendered, deferring to Selenium: {url}")
+                return False
+            
+            self.logger.info(f"⚡ Fetched with plain HTTP: {url}")
+            self._populate_node(node, soup, content, final_url, 'http')
+            return True
+            
+        except Exception as e:
+            self.logger.debug(f"Plain HTTP fetch failed for {url}, deferring to Selenium: {e}")
+            return False
+    
+    def _populate_node(self, node: GraphNode, soup: BeautifulSoup, content: str, final_url: str, method: str):
+        """Fill a node from parsed HTML and mark it crawled"""
+        # Extract title
+        title_element = soup.find('title')
+        node.title = title_element.get_text(strip=True) if title_element else node.url
+        
+        node.content = content
+        
+        # Extract links
+        node.outbound_links = self._extract_links(soup, node.url)
+        
+        # Update metadata
+        node.metadata = {
+            'content_length': len(node.content),
+            'links_count': len(node.outbound_links),
+            'title_length': len(node.title),
+            'final_url': final_url,
+            'method': method
+        }
+        
+        node.crawl_status = "crawled"
+    
     def _fetch_with_fallback(self, node: GraphNode) -> bool:
         """Fetch page using fallback requests scraper"""
         try:
@@ -225,30 +308,24 @@ class GraphWebCrawler:
     def _extract_content(self, soup: BeautifulSoup) -> str:
         """Extract meaningful text content from HTML with enhanced filtering"""
         # Remove script and style elements
-        for script in soup(["script", "style", "nav", "footer", "header", "aside", "iframe", "noscript"]):
+        for script in soup(_NON_CONTENT_TAGS):
             script.decompose()
         
         # Remove common noise elements
-        for element in soup.find_all(['div'], class_=re.compile(r'(ad|advertisement|sidebar|navigation|menu|footer|header)', re.I)):
+        for element in soup.find_all(['div'], class_=_NOISE_CLASS_RE):
             element.decompose()
         
         # Get text from meaningful content tags
-        content_tags = soup.find_all([
-            'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 
-            'article', 'main', 'section', 'div', 
-            'li', 'blockquote', 'pre', 'code'
-        ])
+        content_tags = soup.find_all(_CONTENT_TAGS)
         
         content = []
         for tag in content_tags:
             text = tag.get_text(strip=True)
             # Filter out short snippets and common noise
-            if (len(text) > 30 and 
-                not any(noise in text.lower() for noise in [
-                    'cookie', 'privacy policy', 'terms of service', 
-                    'subscribe', 'newsletter', 'advertisement'
-                ])):
-                content.append(text)
+            if len(text) > 30:
+                text_lower = text.lower()
+                if not any(noise in text_lower for noise in _NOISE_PHRASES):
+                    content.append(text)
         
         # Join content and limit length
         full_content = ' '.join(content)
@@ -256,32 +333,79 @@ class GraphWebCrawler:
 
     def _extract_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """Extract and normalize links from the page with better filtering"""
-        links = []
-        for link in soup.find_all('a', href=True):
-            href = link['href']
+        links = {}  # Ordered set of accepted links
+        
+        # De-duplicate raw hrefs first so repeated nav/footer links are only resolved and validated once
+        for href in dict.fromkeys(link['href'] for link in soup.find_all('a', href=True)):
             full_url = urljoin(base_url, href)
             
-            # Enhanced filtering
-            if validators.url(full_url) and full_url.startswith(('http://', 'https://')):
-                parsed = urlparse(full_url)
+            # Enhanced filtering; cheap string checks run before the full URL validation
+            if not full_url.startswith(('http://', 'https://')):
+                continue
+            
+            parsed = urlparse(full_url)
+            
+            # Skip certain file types, fragments, and search URLs
+            if (parsed.path.lower().endswith(_SKIP_LINK_EXTENSIONS) or
+                any(domain in full_url for domain in _SEARCH_URL_MARKERS) or
+                parsed.fragment or  # Remove fragment URLs
+                len(parsed.path) <= 1):  # Avoid root pages only
+                continue
+            
+            if validators.url(full_url):
+                links[full_url.split('#')[0]] = None  # Remove fragments
                 
-                # Skip certain file types, fragments, and search URLs
-                if (not any(parsed.path.lower().endswith(ext) for ext in 
-                           ['.pdf', '.jpg', '.jpeg', '.png', '.gif', '.zip', '.doc', '.docx', '.ppt', '.pptx']) and
-                    not any(domain in full_url for domain in ['google.com/search', 'duckduckgo.com/?q=', 'bing.com/search']) and
-                    not parsed.fragment and  # Remove fragment URLs
-                    len(parsed.path) > 1):  # Avoid root pages only
-                    
-                    links.append(full_url.split('#')[0])  # Remove fragments
+                # Stop once the limit is reached instead of validating the rest of the page
+                if len(links) >= _MAX_LINKS_PER_PAGE:
+                    break
+        
+        return list(links)
+    
+    def _to_page_info(self, node: GraphNode) -> PageInfo:
+        """Convert a crawled GraphNode to PageInfo, resolving its parent URL from the graph"""
+        page_info = PageInfo.from_graph_node(node)
+        if node.parent_node_id and node.parent_node_id in self.graph_nodes:
+            page_info.parent_url = self.graph_nodes[node.parent_node_id].url
+        return page_info
+    
+    def _enqueue_bfs_children(self, node: GraphNode, node_queue: deque, visited_urls: Set[str]):
+        """Create child nodes for a crawled page's unvisited links and add them to the rear of the BFS queue"""
+        child_count = 0
+        max_links_per_page = int(os.getenv('SEARCH_MAX_LINKS_PER_PAGE', 5))
+        
+        for link in node.outbound_links[:max_links_per_page]:  # Use env variable
+            if link not in visited_urls and validators.url(link):
+                child_node = self._create_node(
+                    url=link,
+                    depth=node.depth + 1,
+                    parent_node_id=node.id
+                )
+                node_queue.append(child_node)  # Add to rear of queue
+                visited_urls.add(link)
+                child_count += 1
+        
+        self.logger.debug(f"🔍 BFS: Created {child_count} child nodes and added to queue for depth {node.depth + 1}")
+    
+    def _fallback_fetch_many(self, nodes: List[GraphNode]) -> List[bool]:
+        """Fetch nodes concurrently with the fallback scraper, with at most _FALLBACK_PER_HOST requests per site"""
+        # Plain threads rather than an event loop, so the crawl can be called from code that already runs one
+        host_limits: Dict[str, threading.Semaphore] = {
+            urlparse(node.url).netloc: threading.Semaphore(_FALLBACK_PER_HOST) for node in nodes
+        }
         
-        # Remove duplicates and limit
-        unique_links = list(dict.fromkeys(links))
-        return unique_links[:15]  # Increased link limit for better discovery
+        def _fetch(node: GraphNode) -> bool:
+            with host_limits[urlparse(node.url).netloc]:
+                return self._fetch_with_fallback(node)
+        
+        with ThreadPoolExecutor(max_workers=max(len(nodes), 1)) as executor:
+            return list(executor.map(_fetch, nodes))
     
-    def search_crawl_bfs(self, start_urls: List[str], max_depth: int = 2) -> Dict[str, PageInfo]:
+    def search_crawl_bfs(self, start_urls: List[str], max_depth: int = 2,
+                         on_page: Optional[Callable[[PageInfo], None]] = None) -> Dict[str, PageInfo]:
         """
         BFS-based search crawling using a queue (FIFO) with proper graph structure
         Each queue item is a GraphNode, maintaining proper parent-child relationships
+        If on_page is given, it is called with each PageInfo as soon as that page is crawled
         """
         visited_urls: Set[str] = set()
         node_queue = deque()  # Queue of GraphNode objects for BFS (FIFO)
@@ -301,6 +425,33 @@ class GraphWebCrawler:
         self.logger.info("🔍 BFS: Starting breadth-first exploration using FIFO node queue")
         
         while node_queue and pages_crawled < self.max_pages:
+            # Without a browser every fetch is a plain HTTP request, so the front of the queue is fetched concurrently
+            if not self.selenium_available:
+                batch = []
+                while node_queue and len(batch) < min(self.max_pages - pages_crawled, _FALLBACK_BATCH_SIZE):
+                    node = node_queue.popleft()
+                    queue_operations += 1
+                    if node.depth <= max_depth:
+                        batch.append(node)
+                
+                if not batch:
+                    continue
+                
+                # Add delay to be respectful
+                if pages_crawled > 0:
+                    time.sleep(self.delay)
+                
+                for node, fetched in zip(batch, self._fallback_fetch_many(batch)):
+                    if fetched:
+                        pages_crawled += 1
+                        self.logger.info(f"🔍 BFS: Crawled page {pages_crawled}/{self.max_pages} - Node {node.id} - {node.url} at depth {node.depth}")
+                        
+                        if on_page:
+                            on_page(self._to_page_info(node))
+                        
+                        self._enqueue_bfs_children(node, node_queue, visited_urls)
+                continue
+            
             # FIFO operation: remove node from front of queue
             current_node = node_queue.popleft()
             queue_operations += 1
@@ -320,32 +471,17 @@ class GraphWebCrawler:
                 
                 self.logger.info(f"🔍 BFS: Crawled page {pages_crawled}/{self.max_pages} - Node {current_node.id} - {current_node.url} at depth {current_node.depth}")
                 
-                # Create child nodes and add to queue for next level exploration (FIFO)
-                child_count = 0
-                max_links_per_page = int(os.getenv('SEARCH_MAX_LINKS_PER_PAGE', 5))
+                if on_page:
+                    on_page(self._to_page_info(current_node))
                 
-                for link in current_node.outbound_links[:max_links_per_page]:  # Use env variable
-                    if link not in visited_urls and validators.url(link):
-                        child_node = self._create_node(
-                            url=link,
-                            depth=current_node.depth + 1,
-                            parent_node_id=current_node.id
-                        )
-                        node_queue.append(child_node)  # Add to rear of queue
-                        visited_urls.add(link)
-                        child_count += 1
-                
-                self.logger.debug(f"🔍 BFS: Created {child_count} child nodes and added to queue for depth {current_node.depth + 1}")
+                # Create child nodes and add to queue for next level exploration (FIFO)
+                self._enqueue_bfs_children(current_node, node_queue, visited_urls)
         
         # Convert graph nodes to PageInfo for backward compatibility
         pages = {}
         for node in self.graph_nodes.values():
             if node.crawl_status == "crawled":
-                page_info = PageInfo.from_graph_node(node)
-                # Resolve parent URL from graph
-                if node.parent_node_id and node.parent_node_id in self.graph_nodes:
-                    page_info.parent_url = self.graph_nodes[node.parent_node_id].url
-                pages[node.url] = page_info
+                pages[node.url] = self._to_page_info(node)
         
         self.logger.info(f"🔍 BFS: Completed with {len(pages)} pages crawled using {queue_operations} queue operations")
         self.logger.info(f"📊 Graph Statistics: {len(self.graph_nodes)} nodes total, {len([n for n in self.graph_nodes.values() if n.crawl_status == 'crawled'])} successfully crawled")
@@ -537,35 +673,48 @@ class GraphWebCrawler:
         if not pages:
             return {}
         
-        depths = [page.depth for page in pages.values()]
-        domains = [urlparse(url).netloc for url in pages.keys()]
+        # numpy is only needed here, so importing graph_crawler doesn't pay for it
+        import numpy as np
         
-        # Calculate depth distribution
-        depth_distribution = {}
-        for depth in depths:
-            depth_distribution[depth] = depth_distribution.get(depth, 0) + 1
+        # Depths as one contiguous array, so the distribution and summary stats are single C passes
+        depths = np.fromiter((page.depth for page in pages.values()), dtype=np.int64, count=len(pages))
+        domain_counts = Counter(urlparse(url).netloc for url in pages.keys())
         
-        # Graph-specific statistics
-        total_nodes = len(self.graph_nodes)
-        crawled_nodes = len([n for n in self.graph_nodes.values() if n.crawl_status == "crawled"])
-        failed_nodes = len([n for n in self.graph_nodes.values() if n.crawl_status == "failed"])
-        pending_nodes = len([n for n in self.graph_nodes.values() if n.crawl_status == "pending"])
+        # Calculate depth distribution
+        depth_counts = np.bincount(depths)
+        depth_distribution = {int(depth): int(depth_counts[depth]) for depth in np.flatnonzero(depth_counts)}
+        max_depth = int(depths.max())
+        min_depth = int(depths.min())
+        
+        # Graph-specific statistics; node attributes are gathered into numpy columns once,
+        # then every metric is a vectorized reduction instead of another pass over the nodes
+        nodes = list(self.graph_nodes.values())
+        total_nodes = len(nodes)
+        status = np.fromiter((_STATUS_CODES.get(n.crawl_status, _OTHER_STATUS) for n in nodes), dtype=np.int8, count=total_nodes)
+        child_counts = np.fromiter((len(n.child_node_ids) for n in nodes), dtype=np.int64, count=total_nodes)
+        link_counts = np.fromiter((len(n.outbound_links) for n in nodes), dtype=np.int64, count=total_nodes)
+        has_parent = np.fromiter((bool(n.parent_node_id) for n in nodes), dtype=bool, count=total_nodes)
+        
+        status_counts = np.bincount(status, minlength=len(_STATUS_CODES) + 1)
+        crawled_nodes = int(status_counts[_STATUS_CODES["crawled"]])
+        failed_nodes = int(status_counts[_STATUS_CODES["failed"]])
+        pending_nodes = int(status_counts[_STATUS_CODES["pending"]])
         
         # Calculate graph connectivity metrics
-        nodes_with_children = len([n for n in self.graph_nodes.values() if n.child_node_ids])
-        nodes_with_parents = len([n for n in self.graph_nodes.values() if n.parent_node_id])
-        root_nodes = len([n for n in self.graph_nodes.values() if not n.parent_node_id])
-        leaf_nodes = len([n for n in self.graph_nodes.values() if not n.child_node_ids])
+        nodes_with_children = int(np.count_nonzero(child_counts))
+        nodes_with_parents = int(np.count_nonzero(has_parent))
+        root_nodes = total_nodes - nodes_with_parents
+        leaf_nodes = total_nodes - nodes_with_children
         
         return {
             'total_pages': len(pages),
-            'max_depth': max(depths) if depths else 0,
-            'min_depth': min(depths) if depths else 0,
-            'avg_depth': sum(depths) / len(depths) if depths else 0,
-            'unique_domains': len(set(domains)),
+            'max_depth': max_depth,
+            'min_depth': min_depth,
+            'avg_depth': float(depths.mean()),
+            'unique_domains': len(domain_counts),
             'pages_by_depth': depth_distribution,
-            'domain_distribution': {domain: domains.count(domain) for domain in set(domains)},
-            'depth_range': max(depths) - min(depths) if depths else 0,
+            'domain_distribution': dict(domain_counts),
+            'depth_range': max_depth - min_depth,
             
             # Graph-specific metrics
             'graph_metrics': {
@@ -578,8 +727,8 @@ class GraphWebCrawler:
                 'nodes_with_parents': nodes_with_parents,
                 'root_nodes': root_nodes,
                 'leaf_nodes': leaf_nodes,
-                'avg_children_per_node': sum(len(n.child_node_ids) for n in self.graph_nodes.values()) / total_nodes if total_nodes > 0 else 0,
-                'avg_links_per_node': sum(len(n.outbound_links) for n in self.graph_nodes.values() if n.crawl_status == "crawled") / crawled_nodes if crawled_nodes > 0 else 0
+                'avg_children_per_node': int(child_counts.sum()) / total_nodes if total_nodes > 0 else 0,
+                'avg_links_per_node': int(link_counts[status == _STATUS_CODES["crawled"]].sum()) / crawled_nodes if crawled_nodes > 0 else 0
             }
         }
     
@@ -1,6 +1,7 @@
 import openai
 import os
-from typing import List, Dict, Optional
+import asyncio
+from typing import List, Dict, Optional, AsyncIterator
 import logging
 from dataclasses import dataclass
 from graph_crawler import PageInfo
@@ -167,6 +168,29 @@ OUTPUT FORMAT (JSON):
             ai_summary = self._summarize_single_page(page, query)
             page_summaries.append(ai_summary)
         
+        return self._synthesize_analysis(query, page_summaries, crawl_type)
+    
+    async def astream_analyze(self, query: str, pages_stream: AsyncIterator[PageInfo], crawl_type: str) -> AnalysisResult:
+        """
+        Async variant of analyze_crawled_content that consumes pages as they are crawled.
+        Each page is summarized as soon as it arrives, so per-page LLM calls overlap
+        with the rest of the crawl instead of waiting for it to finish.
+        """
+        self.logger.info("🤖 Streaming AI page summarization alongside crawling...")
+        summary_tasks = []
+        
+        async for page in pages_stream:
+            summary_tasks.append(asyncio.create_task(
+                asyncio.to_thread(self._summarize_single_page, page, query)
+            ))
+        
+        page_summaries = list(await asyncio.gather(*summary_tasks))
+        self.logger.info(f"🤖 AI summarized {len(page_summaries)} streamed pages")
+        
+        return await asyncio.to_thread(self._synthesize_analysis, query, page_summaries, crawl_type)
+    
+    def _synthesize_analysis(self, query: str, page_summaries: List[PageSummary], crawl_type: str) -> AnalysisResult:
+        """Combine individual page summaries into a comprehensive AI analysis"""
         # Sort by AI-calculated relevance score
         page_summaries.sort(key=lambda x: x.relevance_score, reverse=True)
         
@@ -1,5 +1,6 @@
 import logging
 from typing import Dict, List, Tuple
+import asyncio
 import time
 import os
 from dotenv import load_dotenv
@@ -32,6 +33,9 @@ class ResearchService:
         self.conversation_history = []
         self.last_research_results = {}
         
+        # (pages, statistics) from the most recent research run
+        self._last_stats = None
+        
         self.logger = logging.getLogger(__name__)
     
     def __del__(self):
@@ -63,11 +67,13 @@ class ResearchService:
         if not self.conversation_history:
             return ""
         
-        context = "Recent conversation context:\n"
-        for conv in self.conversation_history[-3:]:  # Last 3 conversations
-            context += f"- Asked about: {conv['query']} (Type: {conv['type']})\n"
+        parts = ["Recent conversation context:\n"]
+        parts.extend(
+            f"- Asked about: {conv['query']} (Type: {conv['type']})\n"
+            for conv in self.conversation_history[-3:]  # Last 3 conversations
+        )
         
-        return context
+        return "".join(parts)
     
     def search_research(self, query: str, max_depth: int = None) -> Tuple[AnalysisResult, Dict[str, PageInfo], Dict]:
         """
@@ -95,30 +101,16 @@ class ResearchService:
         self.logger.info(f"Generated {len(start_urls)} starting URLs from search results and topic sources")
         
         # Log the types of URLs we're getting
-        search_result_urls = [url for url in start_urls if any(domain in url for domain in ['google.com/search', 'duckduckgo.com'])]
-        actual_content_urls = [url for url in start_urls if not any(domain in url for domain in ['google.com/search', 'duckduckgo.com'])]
-        
-        self.logger.info(f"Search result URLs: {len(search_result_urls)}, Content URLs: {len(actual_content_urls)}")
-        
-        # If we have too many search URLs and not enough content URLs, this indicates an issue
-        if len(search_result_urls) > len(actual_content_urls):
-            self.logger.warning("More search URLs than content URLs detected. Search extraction may need improvement.")
+        search_result_urls, actual_content_urls = self._classify_start_urls(start_urls)
         
         # Perform BFS crawling
         crawled_pages = self.crawler.search_crawl_bfs(start_urls, max_depth=max_depth)
         self.logger.info(f"BFS crawling completed. Found {len(crawled_pages)} pages")
         
         # Generate enhanced statistics
-        statistics = self.crawler.get_crawl_statistics(crawled_pages)
-        statistics['crawl_time'] = time.time() - start_time
-        statistics['method'] = 'BFS (Breadth-First Search)'
-        statistics['algorithm_type'] = 'search_bfs'
-        statistics['data_structure'] = 'Queue (FIFO)'
-        statistics['algorithm_details'] = 'Uses queue for level-by-level exploration, ensuring comprehensive coverage at each depth'
-        statistics['exploration_pattern'] = 'Breadth-first: explores all nodes at depth d before exploring nodes at depth d+1'
-        statistics['best_for'] = 'Quick overview, finding shortest paths, broad topic coverage'
-        statistics['search_result_urls'] = len(search_result_urls)
-        statistics['content_urls'] = len(actual_content_urls)
+        statistics = self._build_search_statistics(
+            crawled_pages, time.time() - start_time, search_result_urls, actual_content_urls
+        )
         
         # Add conversation context to analysis
         context = self.get_conversation_context()
@@ -146,6 +138,111 @@ class ResearchService:
         self.logger.info("Search research completed")
         return analysis_result, crawled_pages, statistics
     
+    async def asearch_research(self, query: str, max_depth: int = None) -> Tuple[AnalysisResult, Dict[str, PageInfo], Dict]:
+        """
+        Async variant of search_research that pipelines crawling and LLM analysis.
+        Pages are handed to the LLM service as soon as the BFS crawl yields them,
+        so per-page summarization overlaps with the remaining crawl.
+        Returns: (analysis_result, crawled_pages, statistics)
+        """
+        if max_depth is None:
+            max_depth = int(os.getenv('SEARCH_MAX_DEPTH', 1))
+        
+        max_pages = int(os.getenv('SEARCH_MAX_PAGES', 25))
+        delay_multiplier = float(os.getenv('SEARCH_DELAY_MULTIPLIER', 0.7))
+        
+        original_delay = self.crawler.delay
+        self.crawler.delay = original_delay * delay_multiplier
+        self.crawler.max_pages = max_pages
+        
+        self.logger.info(f"🔍 ASYNC SEARCH CONFIG: max_depth={max_depth}, max_pages={max_pages}, delay={self.crawler.delay}")
+        self.logger.info(f"Starting async SEARCH research for query: {query}")
+        start_time = time.time()
+        
+        # Conversation context only changes after research completes, so resolve it up front
+        context = self.get_conversation_context()
+        query_with_context = f"{query}\n\nContext: {context}" if context else query
+        
+        start_urls = await self.search_engine.aget_search_urls(query)
+        self.logger.info(f"Generated {len(start_urls)} starting URLs from search results and topic sources")
+        search_result_urls, actual_content_urls = self._classify_start_urls(start_urls)
+        
+        # The crawler runs in a worker thread and pushes each page onto the loop's queue
+        loop = asyncio.get_running_loop()
+        page_queue: asyncio.Queue = asyncio.Queue()
+        crawl_time = 0.0
+        
+        def on_page(page: PageInfo):
+            loop.call_soon_threadsafe(page_queue.put_nowait, page)
+        
+        async def pages_stream():
+            while True:
+                page = await page_queue.get()
+                if page is None:
+                    return
+                yield page
+        
+        async def crawl() -> Dict[str, PageInfo]:
+            nonlocal crawl_time
+            try:
+                return await asyncio.to_thread(
+                    self.crawler.search_crawl_bfs, start_urls, max_depth, on_page
+                )
+            finally:
+                crawl_time = time.time() - start_time
+                page_queue.put_nowait(None)
+        
+        crawled_pages, analysis_result = await asyncio.gather(
+            crawl(),
+            self.llm_service.astream_analyze(query_with_context, pages_stream(), "BFS Search")
+        )
+        self.logger.info(f"BFS crawling completed. Found {len(crawled_pages)} pages")
+        
+        statistics = self._build_search_statistics(
+            crawled_pages, crawl_time, search_result_urls, actual_content_urls
+        )
+        
+        results = {
+            'analysis': analysis_result,
+            'pages': crawled_pages,
+            'statistics': statistics
+        }
+        self.add_conversation_context(query, "search", results)
+        
+        self.crawler.delay = original_delay
+        
+        self.logger.info("Async search research completed")
+        return analysis_result, crawled_pages, statistics
+    
+    def _classify_start_urls(self, start_urls: List[str]) -> Tuple[List[str], List[str]]:
+        """Split start URLs into search-engine result URLs and actual content URLs"""
+        search_result_urls = [url for url in start_urls if any(domain in url for domain in ['google.com/search', 'duckduckgo.com'])]
+        actual_content_urls = [url for url in start_urls if not any(domain in url for domain in ['google.com/search', 'duckduckgo.com'])]
+        
+        self.logger.info(f"Search result URLs: {len(search_result_urls)}, Content URLs: {len(actual_content_urls)}")
+        
+        # If we have too many search URLs and not enough content URLs, this indicates an issue
+        if len(search_result_urls) > len(actual_content_urls):
+            self.logger.warning("More search URLs than content URLs detected. Search extraction may need improvement.")
+        
+        return search_result_urls, actual_content_urls
+    
+    def _build_search_statistics(self, crawled_pages: Dict[str, PageInfo], crawl_time: float,
+                                 search_result_urls: List[str], actual_content_urls: List[str]) -> Dict:
+        """Generate enhanced statistics for a BFS search research run"""
+        statistics = self.crawler.get_crawl_statistics(crawled_pages)
+        statistics['crawl_time'] = crawl_time
+        statistics['method'] = 'BFS (Breadth-First Search)'
+        statistics['algorithm_type'] = 'search_bfs'
+        statistics['data_structure'] = 'Queue (FIFO)'
+        statistics['algorithm_details'] = 'Uses queue for level-by-level exploration, ensuring comprehensive coverage at each depth'
+        statistics['exploration_pattern'] = 'Breadth-first: explores all nodes at depth d before exploring nodes at depth d+1'
+        statistics['best_for'] = 'Quick overview, finding shortest paths, broad topic coverage'
+        statistics['search_result_urls'] = len(search_result_urls)
+        statistics['content_urls'] = len(actual_content_urls)
+        self._last_stats = (crawled_pages, dict(statistics))
+        return statistics
+    
     def deep_research(self, query: str, bfs_pages: int = None, dfs_depth: int = None) -> Tuple[AnalysisResult, Dict[str, PageInfo], Dict]:
         """
         Perform deep research using combined BFS + DFS algorithm with environment configuration
@@ -198,6 +295,7 @@ class ResearchService:
         statistics['phase_2'] = 'DFS for deep exploration'
         statistics['search_result_urls'] = len(search_result_urls)
         statistics['content_urls'] = len(actual_content_urls)
+        self._last_stats = (crawled_pages, dict(statistics))
         
         # Add conversation context to analysis
         context = self.get_conversation_context()
@@ -292,8 +390,13 @@ class ResearchService:
     def clear_graph_state(self):
         """Clear the graph state for a fresh research session"""
         self.crawler.clear_graph()
+        self._last_stats = None
         self.logger.info("🔄 Graph state cleared for new research session")
     
     def get_enhanced_statistics(self, pages: Dict[str, PageInfo]) -> Dict:
         """Get enhanced statistics including graph metrics"""
+        # Reuse the statistics computed by the last research run for the same pages; callers get
+        # their own copy (as does the research run itself) so a mutation can't leak into the cache
+        if self._last_stats and self._last_stats[0] is pages:
+            return dict(self._last_stats[1])
         return self.crawler.get_crawl_statistics(pages)
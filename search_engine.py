@@ -1,16 +1,242 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import urllib.parse
-from typing import List
+import asyncio
+import contextlib
+import itertools
+from typing import Dict, Iterable, Iterator, List, FrozenSet, Tuple
 import logging
 import time
 import re
 import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from cache_utils import ttl_lru_cache, coalesce_inflight, make_cache_key, SQLiteTTLCache
 
 # Load environment variables
 load_dotenv()
 
+# Topic keyword sets, matched against the query's word tokens.
+# Multi-word keywords can't match a single token, so they are kept as phrases
+# and checked as substrings of the lower-cased query.
+_KW_SWE = frozenset({'software', 'development', 'engineering', 'programming', 'deployment', 'devops'})
+_PHRASES_SWE = ('ci/cd',)
+_KW_AI = frozenset({'ai', 'ml', 'neural'})
+_PHRASES_AI = ('artificial intelligence', 'machine learning', 'deep learning')
+_KW_DEVOPS = frozenset({'devops', 'deployment', 'docker', 'kubernetes', 'aws', 'cloud', 'infrastructure'})
+_KW_NEWS = frozenset({'latest', 'trends', 'news', 'recent', 'current', 'practices'})
+_KW_ACADEMIC = frozenset({'research', 'study', 'academic', 'paper', 'analysis'})
+_KW_BUSINESS = frozenset({'business', 'industry', 'enterprise', 'company', 'organization'})
+
+_URLS_SWE = (
+    "https://martinfowler.com",
+    "https://www.thoughtworks.com/insights",
+    "https://github.blog/category/engineering/",
+    "https://stackoverflow.blog",
+    "https://www.infoq.com",
+    "https://dzone.com",
+    "https://medium.com/tag/software-engineering",
+    "https://dev.to",
+    "https://hackernoon.com",
+    "https://www.freecodecamp.org/news"
+)
+_URLS_AI = (
+    "https://ai.googleblog.com",
+    "https://openai.com/blog",
+    "https://blog.deepmind.com",
+    "https://ai.facebook.com/blog",
+    "https://distill.pub",
+    "https://towardsdatascience.com",
+    "https://machinelearningmastery.com",
+    "https://www.analyticsvidhya.com/blog",
+    "https://neptune.ai/blog",
+    "https://papers.withcode.com"
+)
+_URLS_DEVOPS = (
+    "https://aws.amazon.com/blogs/devops/",
+    "https://kubernetes.io/blog/",
+    "https://www.docker.com/blog/",
+    "https://azure.microsoft.com/en-us/blog/",
+    "https://cloud.google.com/blog/",
+    "https://www.hashicorp.com/blog",
+    "https://blog.digitalocean.com",
+    "https://www.redhat.com/en/blog",
+    "https://platform.sh/blog/",
+    "https://circleci.com/blog/"
+)
+_URLS_NEWS = (
+    "https://techcrunch.com",
+    "https://arstechnica.com",
+    "https://www.wired.com",
+    "https://www.theverge.com",
+    "https://hbr.org/topic/technology",
+    "https://slashdot.org",
+    "https://news.ycombinator.com",
+    "https://www.zdnet.com"
+)
+_URLS_ACADEMIC = (
+    "https://arxiv.org",
+    "https://www.acm.org/publications",
+    "https://ieeexplore.ieee.org",
+    "https://www.researchgate.net",
+    "https://scholar.google.com"
+)
+_URLS_BUSINESS = (
+    "https://www.mckinsey.com/capabilities/mckinsey-digital",
+    "https://www2.deloitte.com/us/en/insights/focus/tech-trends.html",
+    "https://www.gartner.com/en/newsroom",
+    "https://www.forrester.com/blogs/",
+    "https://sloanreview.mit.edu"
+)
+
+# Fallback keyword sets and URLs used when search engines return nothing
+_KW_FALLBACK_TECH = frozenset({'technology', 'programming', 'software', 'web'})
+_KW_FALLBACK_SCIENCE = frozenset({'science', 'research', 'study'})
+_KW_FALLBACK_NEWS = frozenset({'news', 'current', 'latest'})
+
+_FALLBACK_URLS_GENERAL = (
+    "https://httpbin.org/html",
+    "https://en.wikipedia.org/wiki/Main_Page",
+    "https://www.w3.org/",
+    "https://developer.mozilla.org/",
+    "https://github.com/",
+    "https://stackoverflow.com/"
+)
+_FALLBACK_URLS_TECH = (
+    "https://www.w3schools.com/",
+    "https://developer.mozilla.org/en-US/docs/Web",
+    "https://www.freecodecamp.org/"
+)
+_FALLBACK_URLS_SCIENCE = (
+    "https://www.nature.com/",
+    "https://www.sciencedirect.com/",
+    "https://pubmed.ncbi.nlm.nih.gov/"
+)
+_FALLBACK_URLS_NEWS = (
+    "https://www.bbc.com/",
+    "https://www.reuters.com/",
+    "https://www.cnn.com/"
+)
+
+# (keywords, phrases, urls) per topic, in the order results are emitted
+_TOPIC_TABLE: Tuple[Tuple[FrozenSet[str], Tuple[str, ...], Tuple[str, ...]], ...] = (
+    (_KW_SWE, _PHRASES_SWE, _URLS_SWE),             # Software Engineering & Development
+    (_KW_AI, _PHRASES_AI, _URLS_AI),                # AI & Machine Learning
+    (_KW_DEVOPS, (), _URLS_DEVOPS),                 # DevOps & Deployment
+    (_KW_NEWS, (), _URLS_NEWS),                     # Technology News & Trends
+    (_KW_ACADEMIC, (), _URLS_ACADEMIC),             # Academic & Research
+    (_KW_BUSINESS, (), _URLS_BUSINESS),             # Business & Industry
+)
+
+_FALLBACK_TABLE: Tuple[Tuple[FrozenSet[str], Tuple[str, ...]], ...] = (
+    (_KW_FALLBACK_TECH, _FALLBACK_URLS_TECH),
+    (_KW_FALLBACK_SCIENCE, _FALLBACK_URLS_SCIENCE),
+    (_KW_FALLBACK_NEWS, _FALLBACK_URLS_NEWS),
+)
+
+_TOKEN_RE = re.compile(r'\w+')
+
+# Google wraps result links as /url?q=<target>&...; capture the encoded target
+_GOOGLE_HREF_RE = re.compile(r'^/url\?q=([^&]+)')
+
+# Hosts the SERP scrapers talk to; pre-connected in the background on startup
+_WARMUP_URLS = ('https://duckduckgo.com', 'https://www.google.com')
+
+# SERPs are parsed as they download, in chunks of this many bytes
+_STREAM_CHUNK_SIZE = 8192
+
+# After an early stop, up to this many bytes of a SERP are still read (unparsed) so the
+# kept-alive connection goes back to the pool; larger leftovers close it instead
+_MAX_DRAIN_BYTES = 1024 * 1024
+
+# Each engine contributes at most this many result URLs
+_MAX_ENGINE_RESULTS = 5
+
+# Final number of URLs handed to the crawler, and the share topic sources may take
+_MAX_SEARCH_URLS = 10
+_MAX_TOPIC_URLS = 8
+_MAX_FALLBACK_URLS = 6
+
+
+def _tokenize_query(query_lower: str) -> FrozenSet[str]:
+    """Split a lower-cased query into word tokens (plus naive singulars, so 'papers' matches 'paper')"""
+    words = _TOKEN_RE.findall(query_lower)
+    return frozenset(words).union(word[:-1] for word in words if len(word) > 3 and word.endswith('s'))
+
+
+def _query_key(engine: 'SearchEngine', query: str) -> str:
+    """Normalized query used to key the search URL caches"""
+    return query.strip().lower()
+
+
+def _drain_anchors(parser) -> Iterator[Tuple[str, str]]:
+    """Yield (href, class) for the <a> elements a pull parser has finished, then free them"""
+    for _, elem in parser.read_events():
+        yield elem.get('href', ''), elem.get('class', '')
+        elem.clear()
+
+
+def _iter_anchors(response) -> Iterator[Tuple[str, str]]:
+    """Incrementally parse a streamed HTML response, yielding (href, class) per <a> as chunks arrive"""
+    from lxml import etree  # Imported lazily; only needed once a SERP arrives
+    parser = etree.HTMLPullParser(events=('end',), tag='a')
+    for chunk in response.iter_content(_STREAM_CHUNK_SIZE):
+        parser.feed(chunk)
+        yield from _drain_anchors(parser)
+    parser.close()
+    yield from _drain_anchors(parser)
+
+
+def _drain(response):
+    """Discard what's left of a streamed body, up to _MAX_DRAIN_BYTES, so the connection can be reused"""
+    remaining = _MAX_DRAIN_BYTES
+    try:
+        for chunk in response.iter_content(_STREAM_CHUNK_SIZE):
+            remaining -= len(chunk)
+            if remaining <= 0:
+                break
+    except Exception:
+        pass  # response.close() then simply drops the connection
+
+
+@contextlib.contextmanager
+def _streamed_get(session, url: str):
+    """GET url with a streamed body; on exit the rest of the body is drained before the response is released"""
+    response = session.get(url, timeout=10, stream=True)
+    try:
+        yield response
+    finally:
+        _drain(response)
+        response.close()
+
+
+def _fill_urls(out: Dict[str, None], urls: Iterable[str], limit: int = _MAX_SEARCH_URLS) -> int:
+    """Add urls to the ordered set out until it holds limit entries; returns how many were consumed"""
+    consumed = 0
+    for url in urls:
+        if len(out) >= limit:
+            break
+        out[url] = None
+        consumed += 1
+    return consumed
+
+
+def _unique(urls: Iterable[str]) -> Iterator[str]:
+    """Yield urls in order, skipping repeats"""
+    seen = set()
+    for url in urls:
+        if url not in seen:
+            seen.add(url)
+            yield url
+
+
+def _matches_topic(query_lower: str, tokens: FrozenSet[str], keywords: FrozenSet[str], phrases: Tuple[str, ...] = ()) -> bool:
+    """Check whether the query hits a topic's keyword set or any of its phrases"""
+    return not keywords.isdisjoint(tokens) or any(phrase in query_lower for phrase in phrases)
+
 class SearchEngine:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
@@ -18,46 +244,160 @@ class SearchEngine:
         # Use user agent from environment variable
         user_agent = os.getenv('USER_AGENT', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
         self.session.headers.update({
-            'User-Agent': user_agent
+            'User-Agent': user_agent,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
         })
+        
+        # Larger keep-alive pool for concurrent engine/page fetches, with backoff on transient errors.
+        # 429 is deliberately not retried: hammering an engine that is rate-limiting us gets us blocked
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Persistent query -> URL cache so popular queries survive restarts (SEARCH_DISK_CACHE_TTL=0 disables)
+        self.disk_cache_ttl = int(os.getenv('SEARCH_DISK_CACHE_TTL', 86400))
+        self.disk_cache = self._open_disk_cache() if self.disk_cache_ttl > 0 else None
+        
+        # Pay DNS + TLS handshakes for the search engines while the rest of the app starts up
+        if os.getenv('SEARCH_WARMUP', 'true').lower() == 'true':
+            self._warmup_connections()
+    
+    def _warmup_connections(self):
+        """Open pooled connections to the search engines in background threads"""
+        def _head(url: str):
+            try:
+                self.session.head(url, timeout=5)
+            except Exception as e:
+                self.logger.debug(f"Connection warmup for {url} failed: {e}")
+        
+        for url in _WARMUP_URLS:
+            threading.Thread(target=_head, args=(url,), daemon=True).start()
+    
+    def _open_disk_cache(self):
+        """Open the SQLite-backed search URL cache, or return None if it is unavailable"""
+        cache_dir = os.getenv('SEARCH_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'search_cache'))
+        try:
+            return SQLiteTTLCache(os.path.join(cache_dir, 'search_urls.db'))
+        except Exception as e:
+            self.logger.warning(f"Search disk cache unavailable, continuing without it: {e}")
+            return None
     
     def get_search_urls(self, query: str) -> List[str]:
         """Get actual URLs from search results and topic-specific sources"""
-        all_urls = []
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.aget_search_urls(query))
+        
+        # Called synchronously from code that already runs an event loop (async handlers, notebooks),
+        # where asyncio.run would raise; run the lookup on its own loop in a helper thread instead
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.aget_search_urls(query)).result()
+    
+    @staticmethod
+    def cache_info():
+        """Hit/miss statistics for the search URL cache"""
+        return SearchEngine._search_urls.cache_info()
+    
+    async def aget_search_urls(self, query: str) -> List[str]:
+        """Async variant of get_search_urls; search engines are queried concurrently"""
+        urls, _ = await self._search_urls(query)
+        # Cached and coalesced results are shared, so every caller gets its own list
+        return list(urls)
+    
+    # Query popularity is heavily skewed, so repeated queries are served from an
+    # in-process LRU cache (shared across instances) for up to 6 hours, and
+    # identical queries already being fetched share that single upstream fetch.
+    # Like the disk cache, only results backed by live search results are kept
+    @ttl_lru_cache(maxsize=2048, ttl=21600, key=_query_key, cache_if=lambda result: result[1])
+    @coalesce_inflight(key=_query_key)
+    async def _search_urls(self, query: str) -> Tuple[List[str], bool]:
+        """Build the URL list for a query; returns (urls, whether live search results backed them)"""
+        cache_key = make_cache_key(['v1', _query_key(self, query)])
+        if self.disk_cache:
+            cached_urls = self.disk_cache.get(cache_key)
+            if cached_urls:
+                self.logger.info(f"Using {len(cached_urls)} cached URLs for query: {query}")
+                return cached_urls, True
+        
+        # URLs are de-duplicated as they are produced, and each phase stops once the quota is met
+        collected: Dict[str, None] = {}
         
         # Try to get actual search results
-        search_results = self._get_actual_search_results(query)
-        all_urls.extend(search_results)
+        search_results = await self._get_actual_search_results(query)
+        _fill_urls(collected, search_results)
+        
+        # Tokenize once; both the topic and fallback lookups match against the same token set
+        query_lower = query.lower()
+        tokens = _tokenize_query(query_lower)
         
         # Add high-quality topic-specific URLs
-        topic_urls = self._get_enhanced_topic_urls(query)
-        all_urls.extend(topic_urls)
+        _fill_urls(collected, self._iter_topic_urls(query_lower, tokens))
         
         # If no URLs found, add fallback URLs
-        if not all_urls:
-            fallback_urls = self._get_fallback_urls(query)
-            all_urls.extend(fallback_urls)
-            self.logger.warning(f"No search results found, using {len(fallback_urls)} fallback URLs")
-        
-        # Remove duplicates and limit results
-        unique_urls = list(dict.fromkeys(all_urls))  # Preserves order
+        if not collected:
+            fallback_count = _fill_urls(collected, self._iter_fallback_urls(tokens))
+            self.logger.warning(f"No search results found, using {fallback_count} fallback URLs")
         
+        unique_urls = list(collected)
         self.logger.info(f"Generated {len(unique_urls)} quality URLs for query: {query}")
-        return unique_urls[:10]  # Return top 10 quality URLs
+        
+        # Only persist live search results, so a transient search outage isn't cached for a day
+        if self.disk_cache and search_results:
+            try:
+                self.disk_cache.set(cache_key, unique_urls, expire=self.disk_cache_ttl)
+            except Exception as e:
+                self.logger.warning(f"Failed to write search disk cache: {e}")
+        
+        return unique_urls, bool(search_results)
     
-    def _get_actual_search_results(self, query: str) -> List[str]:
-        """Extract actual URLs from search engines"""
-        urls = []
+    async def fetch_all(self, urls: List[str]) -> List[str]:
+        """
+        Fetch many URLs concurrently with bounded concurrency (MAX_CONCURRENCY, default 20).
+        Returns page HTML in the same order as urls; failed fetches yield an empty string.
+        """
+        semaphore = asyncio.BoundedSemaphore(int(os.getenv('MAX_CONCURRENCY', 20)))
+        
+        def _fetch(url: str) -> str:
+            response = self.session.get(url, timeout=10)
+            response.raise_for_status()
+            return response.text
         
-        # Try DuckDuckGo first (more reliable for scraping)
-        duckduckgo_urls = self._get_duckduckgo_results(query)
-        urls.extend(duckduckgo_urls)
+        async def _one(url: str) -> str:
+            async with semaphore:
+                return await asyncio.to_thread(_fetch, url)
         
-        # Try Google search (basic extraction)
-        google_urls = self._get_google_results(query)
-        urls.extend(google_urls)
+        # return_exceptions keeps one slow or failing URL from sinking the whole batch
+        results = await asyncio.gather(*[_one(url) for url in urls], return_exceptions=True)
+        
+        pages = []
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                self.logger.warning(f"Failed to fetch {url}: {result}")
+                pages.append("")
+            else:
+                pages.append(result)
+        
+        self.logger.info(f"Fetched {sum(1 for page in pages if page)}/{len(urls)} URLs concurrently")
+        return pages
+    
+    async def _get_actual_search_results(self, query: str) -> List[str]:
+        """Extract actual URLs from search engines"""
+        # Query DuckDuckGo and Google concurrently so latency is max(RTT) rather than the sum.
+        # Both share self.session, so pooled connections are reused across calls.
+        duckduckgo_urls, google_urls = await asyncio.gather(
+            asyncio.to_thread(self._get_duckduckgo_results, query),
+            asyncio.to_thread(self._get_google_results, query)
+        )
         
-        return urls
+        # DuckDuckGo results first (more reliable for scraping), then Google
+        return duckduckgo_urls + google_urls
     
     def _get_google_results(self, query: str) -> List[str]:
         """Get results from Google search"""
@@ -65,26 +405,28 @@ class SearchEngine:
             encoded_query = urllib.parse.quote_plus(query)
             search_url = f"https://www.google.com/search?q={encoded_query}&num=10"
             
-            response = self.session.get(search_url, timeout=10)
-            if response.status_code != 200:
-                self.logger.warning(f"Google search returned status {response.status_code}")
-                return []
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            urls = []
-            
-            # Look for search result links
-            for link in soup.find_all('a'):
-                href = link.get('href', '')
-                if href.startswith('/url?q='):
+            # Stream the SERP and stop parsing as soon as enough results are found
+            with _streamed_get(self.session, search_url) as response:
+                if response.status_code != 200:
+                    self.logger.warning(f"Google search returned status {response.status_code}")
+                    return []
+                
+                urls = []
+                
+                # Look for search result links
+                for href, _ in _iter_anchors(response):
                     # Extract actual URL from Google's redirect
-                    actual_url = href.split('/url?q=')[1].split('&')[0]
-                    actual_url = urllib.parse.unquote(actual_url)
+                    match = _GOOGLE_HREF_RE.match(href)
+                    if not match:
+                        continue
+                    actual_url = urllib.parse.unquote(match.group(1))
                     if actual_url.startswith('http') and not 'google.com' in actual_url:
                         urls.append(actual_url)
+                        if len(urls) >= _MAX_ENGINE_RESULTS:
+                            break
             
             self.logger.info(f"Extracted {len(urls)} URLs from Google search")
-            return urls[:5]
+            return urls
             
         except Exception as e:
             self.logger.error(f"Error getting Google results: {e}")
@@ -96,155 +438,51 @@ class SearchEngine:
             encoded_query = urllib.parse.quote_plus(query)
             search_url = f"https://duckduckgo.com/html/?q={encoded_query}"
             
-            response = self.session.get(search_url, timeout=10)
-            if response.status_code != 200:
-                self.logger.warning(f"DuckDuckGo search returned status {response.status_code}")
-                return []
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            urls = []
-            
-            # DuckDuckGo result links
-            for link in soup.find_all('a', {'class': 'result__a'}):
-                href = link.get('href')
-                if href and href.startswith('http') and not 'duckduckgo.com' in href:
-                    urls.append(href)
+            # Stream the SERP and stop parsing as soon as enough results are found
+            with _streamed_get(self.session, search_url) as response:
+                if response.status_code != 200:
+                    self.logger.warning(f"DuckDuckGo search returned status {response.status_code}")
+                    return []
+                
+                urls = []
+                # Any outbound link, used only if the page has no result__a links
+                alternative_urls = []
+                
+                for href, css_class in _iter_anchors(response):
+                    if not href.startswith('http'):
+                        continue
+                    # DuckDuckGo result links
+                    if 'result__a' in css_class.split():
+                        if not 'duckduckgo.com' in href:
+                            urls.append(href)
+                            if len(urls) >= _MAX_ENGINE_RESULTS:
+                                break
+                    elif not any(blocked in href for blocked in ['duckduckgo.com', 'google.com', 'bing.com']):
+                        alternative_urls.append(href)
             
             # Alternative selector for DuckDuckGo
             if not urls:
-                for link in soup.find_all('a'):
-                    href = link.get('href', '')
-                    if href.startswith('http') and not any(blocked in href for blocked in ['duckduckgo.com', 'google.com', 'bing.com']):
-                        urls.append(href)
+                urls = alternative_urls
             
             self.logger.info(f"Extracted {len(urls)} URLs from DuckDuckGo")
-            return urls[:5]
+            return urls[:_MAX_ENGINE_RESULTS]
             
         except Exception as e:
             self.logger.error(f"Error getting DuckDuckGo results: {e}")
             return []
     
-    def _get_enhanced_topic_urls(self, query: str) -> List[str]:
-        """Get enhanced topic-specific URLs based on query keywords"""
-        urls = []
-        query_lower = query.lower()
+    def _iter_topic_urls(self, query_lower: str, tokens: FrozenSet[str]) -> Iterator[str]:
+        """Yield enhanced topic-specific URLs based on query keywords"""
+        matched = (
+            urls for keywords, phrases, urls in _TOPIC_TABLE
+            if _matches_topic(query_lower, tokens, keywords, phrases)
+        )
         
-        # Software Engineering & Development
-        if any(word in query_lower for word in ['software', 'development', 'engineering', 'programming', 'deployment', 'devops', 'ci/cd']):
-            urls.extend([
-                "https://martinfowler.com",
-                "https://www.thoughtworks.com/insights",
-                "https://github.blog/category/engineering/",
-                "https://stackoverflow.blog",
-                "https://www.infoq.com",
-                "https://dzone.com",
-                "https://medium.com/tag/software-engineering",
-                "https://dev.to",
-                "https://hackernoon.com",
-                "https://www.freecodecamp.org/news"
-            ])
-        
-        # AI & Machine Learning
-        if any(word in query_lower for word in ['ai', 'artificial intelligence', 'machine learning', 'ml', 'deep learning', 'neural']):
-            urls.extend([
-                "https://ai.googleblog.com",
-                "https://openai.com/blog",
-                "https://blog.deepmind.com",
-                "https://ai.facebook.com/blog",
-                "https://distill.pub",
-                "https://towardsdatascience.com",
-                "https://machinelearningmastery.com",
-                "https://www.analyticsvidhya.com/blog",
-                "https://neptune.ai/blog",
-                "https://papers.withcode.com"
-            ])
-        
-        # DevOps & Deployment
-        if any(word in query_lower for word in ['devops', 'deployment', 'docker', 'kubernetes', 'aws', 'cloud', 'infrastructure']):
-            urls.extend([
-                "https://aws.amazon.com/blogs/devops/",
-                "https://kubernetes.io/blog/",
-                "https://www.docker.com/blog/",
-                "https://azure.microsoft.com/en-us/blog/",
-                "https://cloud.google.com/blog/",
-                "https://www.hashicorp.com/blog",
-                "https://blog.digitalocean.com",
-                "https://www.redhat.com/en/blog",
-                "https://platform.sh/blog/",
-                "https://circleci.com/blog/"
-            ])
-        
-        # Technology News & Trends
-        if any(word in query_lower for word in ['latest', 'trends', 'news', 'recent', 'current', 'practices']):
-            urls.extend([
-                "https://techcrunch.com",
-                "https://arstechnica.com",
-                "https://www.wired.com",
-                "https://www.theverge.com",
-                "https://hbr.org/topic/technology",
-                "https://slashdot.org",
-                "https://news.ycombinator.com",
-                "https://www.zdnet.com"
-            ])
-        
-        # Academic & Research
-        if any(word in query_lower for word in ['research', 'study', 'academic', 'paper', 'analysis']):
-            urls.extend([
-                "https://arxiv.org",
-                "https://www.acm.org/publications",
-                "https://ieeexplore.ieee.org",
-                "https://www.researchgate.net",
-                "https://scholar.google.com"
-            ])
-        
-        # Business & Industry
-        if any(word in query_lower for word in ['business', 'industry', 'enterprise', 'company', 'organization']):
-            urls.extend([
-                "https://www.mckinsey.com/capabilities/mckinsey-digital",
-                "https://www2.deloitte.com/us/en/insights/focus/tech-trends.html",
-                "https://www.gartner.com/en/newsroom",
-                "https://www.forrester.com/blogs/",
-                "https://sloanreview.mit.edu"
-            ])
-        
-        # Remove duplicates and return limited set
-        unique_urls = list(dict.fromkeys(urls))
-        return unique_urls[:8]
+        # Remove duplicates and yield a limited set; topics are only matched as far as the caller consumes
+        return itertools.islice(_unique(itertools.chain.from_iterable(matched)), _MAX_TOPIC_URLS)
     
-    def _get_fallback_urls(self, query: str) -> List[str]:
-        """Get reliable fallback URLs when search engines fail"""
-        # General reliable URLs that work in most deployment environments
-        fallback_urls = [
-            "https://httpbin.org/html",
-            "https://en.wikipedia.org/wiki/Main_Page",
-            "https://www.w3.org/",
-            "https://developer.mozilla.org/",
-            "https://github.com/",
-            "https://stackoverflow.com/"
-        ]
-        
-        query_lower = query.lower()
-        
-        # Add query-specific reliable URLs
-        if any(word in query_lower for word in ['technology', 'programming', 'software', 'web']):
-            fallback_urls.extend([
-                "https://www.w3schools.com/",
-                "https://developer.mozilla.org/en-US/docs/Web",
-                "https://www.freecodecamp.org/"
-            ])
-        
-        if any(word in query_lower for word in ['science', 'research', 'study']):
-            fallback_urls.extend([
-                "https://www.nature.com/",
-                "https://www.sciencedirect.com/",
-                "https://pubmed.ncbi.nlm.nih.gov/"
-            ])
-        
-        if any(word in query_lower for word in ['news', 'current', 'latest']):
-            fallback_urls.extend([
-                "https://www.bbc.com/",
-                "https://www.reuters.com/",
-                "https://www.cnn.com/"
-            ])
-        
-        return fallback_urls[:6]  # Return up to 6 fallback URLs
+    def _iter_fallback_urls(self, tokens: FrozenSet[str]) -> Iterator[str]:
+        """Yield reliable fallback URLs when search engines fail"""
+        # General reliable URLs that work in most deployment environments, then query-specific ones
+        matched = (urls for keywords, urls in _FALLBACK_TABLE if not keywords.isdisjoint(tokens))
+        return itertools.islice(itertools.chain(_FALLBACK_URLS_GENERAL, *matched), _MAX_FALLBACK_URLS)
@@ -3,160 +3,452 @@ Selenium utilities for robust web driver management
 """
 
 import os
+import copy
+import json
+import asyncio
+import atexit
+import random
 import time
+import shutil
+import functools
 import logging
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import (
-    TimeoutException, 
-    WebDriverException, 
-    NoSuchElementException,
-    SessionNotCreatedException
-)
-from webdriver_manager.chrome import ChromeDriverManager
-from typing import Optional, Dict, Any
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterable, List, Set, Tuple, TYPE_CHECKING
+from urllib.parse import urlparse
 from dotenv import load_dotenv
 
+# Selenium is heavy to import, so it is imported where
+# a driver is actually used; importing this module stays cheap
+if TYPE_CHECKING:
+    from selenium import webdriver
+
 # Load environment variables
 load_dotenv()
 
+# Serializes the first chromedriver resolution so concurrent managers don't race the download
+_driver_install_lock = threading.Lock()
+
+# chromedriver path resolved for this process, reused by every later launch
+_CHROMEDRIVER_PATH: Optional[str] = None
+
+# chromedriver installed by the chromium-driver system package
+_SYSTEM_CHROMEDRIVER = '/usr/bin/chromedriver'
+
+# URL patterns blocked at the network layer (via CDP) so they are never requested
+_BLOCK_PATTERNS = (
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',  # images
+    '*.css', '*.woff*', '*.ttf',                                      # styles and fonts
+    '*.mp4',                                                          # media
+    '*/analytics*', '*google-analytics*', '*googletagmanager*', '*doubleclick*',  # trackers
+)
+
+# Chrome only honours the last --disable-features switch, so every feature goes into one flag
+_DISABLED_FEATURES = (
+    'VizDisplayCompositor', 'TranslateUI',
+    'IsolateOrigins', 'site-per-process',  # no per-site renderer processes
+    'AudioServiceOutOfProcess',
+)
+
+# Hides navigator.webdriver; installed once per session and run before any page script
+_STEALTH_SCRIPT = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+
+# JS conditions for the common get_page waits; any other wait_for_element is a CSS selector.
+# None means the eager page load strategy already waited enough (driver.get returns after DOMContentLoaded)
+_WAIT_STRATEGIES: Dict[str, Optional[str]] = {
+    'body': 'document.body !== null',
+    'eager-dom': None,
+}
+
+# True once the document has parsed (readyState past 'loading') and the wait condition holds
+_READY_SCRIPT = "return document.readyState !== 'loading' && ({condition})"
+
+# Same check as a promise that settles once DOMContentLoaded has fired (or after a timeout), so a
+# single awaited CDP Runtime.evaluate replaces polling; formatted with the condition and timeout in ms
+_READY_PROMISE = (
+    "new Promise(resolve => {{"
+    " const check = () => resolve({condition});"
+    " if (document.readyState !== 'loading') {{ check(); return; }}"
+    " document.addEventListener('DOMContentLoaded', check, {{once: true}});"
+    " setTimeout(() => resolve(false), {timeout_ms});"
+    " }})"
+)
+
+# Pages shorter than this (or with an empty body) are treated as JavaScript-rendered shells
+_MIN_STATIC_PAGE_LENGTH = 2048
+
+# Concurrent plain-HTTP fetches in get_pages_fast
+_FAST_FETCH_CONCURRENCY = 16
+
+# Seconds after a successful browser command during which is_alive trusts the driver without probing it
+_ALIVE_PROBE_INTERVAL = 30
+
+# Restarts closer together than this (seconds) are treated as a crash loop and backed off
+_RESTART_COOLDOWN = 30
+
+
+def _backoff_delay(attempt: int, base: float = 0.5, cap: float = 8.0) -> float:
+    """Exponential backoff with jitter: base * 2^attempt capped at cap, plus up to 0.5s"""
+    return min(cap, base * (2 ** attempt)) + random.random() * 0.5
+
+
+@functools.lru_cache(maxsize=64)
+def _ready_condition(wait_for_element: str) -> Optional[str]:
+    """JS condition for a get_page wait: a known strategy, else a CSS selector such as '#main'"""
+    if wait_for_element in _WAIT_STRATEGIES:
+        return _WAIT_STRATEGIES[wait_for_element]
+    return f"document.querySelector({json.dumps(wait_for_element)}) !== null"
+
+
+def _origin(url: str) -> Optional[str]:
+    """scheme://host[:port] of an http(s) URL, or None for anything else (about:blank, data:, ...)"""
+    parsed = urlparse(url)
+    if parsed.scheme in ('http', 'https') and parsed.netloc:
+        return f"{parsed.scheme}://{parsed.netloc}"
+    return None
+
+
+def _configure_tab(driver: 'webdriver.Chrome', logger: logging.Logger):
+    """Install the per-tab CDP setup: network-level blocking and the stealth script"""
+    # Block images, fonts, styles and trackers before they hit the network
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(_BLOCK_PATTERNS)})
+    except Exception as e:
+        logger.debug(f"Could not set blocked URLs via CDP: {e}")
+    
+    # Remove automation detection on every document the session loads, before page JS runs
+    try:
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': _STEALTH_SCRIPT})
+    except Exception as e:
+        logger.debug(f"Could not install stealth script via CDP: {e}")
+
+
+def _looks_client_rendered(html: str) -> bool:
+    """Heuristic for pages that need JavaScript: an empty <body> or hardly any markup"""
+    return len(html) < _MIN_STATIC_PAGE_LENGTH or '<body></body>' in html
+
+
+def _local_chromedriver() -> Optional[str]:
+    """chromedriver from CHROMEDRIVER_PATH or the system package, if present"""
+    for path in (os.getenv('CHROMEDRIVER_PATH'), _SYSTEM_CHROMEDRIVER):
+        if path and os.path.exists(path):
+            return path
+    return None
+
+
+def _chromedriver_path() -> Optional[str]:
+    """chromedriver resolved earlier in this process or preinstalled locally; None if not known yet"""
+    global _CHROMEDRIVER_PATH
+    if _CHROMEDRIVER_PATH is None or not os.path.exists(_CHROMEDRIVER_PATH):
+        # A preinstalled driver (deployments) needs no download or version check at all
+        _CHROMEDRIVER_PATH = _local_chromedriver()
+    return _CHROMEDRIVER_PATH
+
+
+def _launch_chrome(chrome_options) -> 'webdriver.Chrome':
+    """Start Chrome; without a known chromedriver, Selenium Manager (built into Selenium) resolves one"""
+    global _CHROMEDRIVER_PATH
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    
+    driver_path = _chromedriver_path()
+    if driver_path:
+        return webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+    
+    # First launch in this process: Selenium Manager may download chromedriver, so concurrent
+    # setups wait here, then reuse the path it resolved instead of asking it again
+    with _driver_install_lock:
+        driver_path = _chromedriver_path()
+        service = Service(driver_path) if driver_path else Service()
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+        if not driver_path and getattr(service, 'path', None):
+            _CHROMEDRIVER_PATH = service.path
+        return driver
+
+
+@functools.lru_cache(maxsize=1)
+def _find_chrome_binary() -> Optional[str]:
+    """Find Chrome binary in deployment environments (looked up once per process)"""
+    logger = logging.getLogger(__name__)
+    
+    # Resolve via PATH first (prioritize new package names)
+    for cmd in ['chromium', 'chromium-browser', 'google-chrome', 'google-chrome-stable']:
+        chrome_path = shutil.which(cmd)
+        if chrome_path:
+            logger.info(f"Found Chrome on PATH: {chrome_path}")
+            return chrome_path
+    
+    # Updated Chrome binary locations for current Streamlit Cloud
+    chrome_paths = [
+        '/usr/bin/chromium',          # Current Streamlit Cloud
+        '/usr/bin/chromium-browser',  # Legacy Streamlit Cloud
+        '/usr/bin/google-chrome',     # If google-chrome-stable works
+        '/usr/bin/google-chrome-stable',
+        '/opt/google/chrome/chrome',
+        '/opt/google/chrome/google-chrome',
+        '/snap/bin/chromium',         # Snap packages
+        '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',  # macOS
+        '/usr/local/bin/google-chrome',
+        '/usr/local/bin/chromium'
+    ]
+    
+    for path in chrome_paths:
+        if os.path.exists(path):
+            logger.info(f"Found Chrome binary: {path}")
+            return path
+    
+    logger.warning("Chrome binary not found")
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _options_prototype(headless: bool, single_process: bool, user_agent: str):
+    """Build the Chrome options for one configuration; cached, so callers must copy before mutating"""
+    from selenium.webdriver.chrome.options import Options
+    
+    chrome_options = Options()
+    
+    # Find Chrome binary for deployment environments
+    chrome_binary = _find_chrome_binary()
+    if chrome_binary:
+        chrome_options.binary_location = chrome_binary
+    
+    # Basic options
+    if headless:
+        chrome_options.add_argument("--headless")
+    
+    # Essential deployment options (optimized for Chromium)
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-web-security")
+    chrome_options.add_argument(f"--disable-features={','.join(_DISABLED_FEATURES)}")
+    chrome_options.add_argument("--disable-background-timer-throttling")
+    chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+    chrome_options.add_argument("--disable-renderer-backgrounding")
+    
+    # Run the browser in one process (lower RSS, faster startup)
+    if single_process:
+        chrome_options.add_argument("--single-process")
+        chrome_options.add_argument("--no-zygote")
+    
+    # Additional Chromium compatibility options
+    chrome_options.add_argument("--disable-setuid-sandbox")
+    chrome_options.add_argument("--disable-software-rasterizer")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-default-apps")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument("--no-first-run")
+    chrome_options.add_argument("--no-default-browser-check")
+    
+    # Background services a crawler never needs
+    chrome_options.add_argument("--disable-component-update")
+    chrome_options.add_argument("--disable-breakpad")
+    chrome_options.add_argument("--disable-client-side-phishing-detection")
+    chrome_options.add_argument("--metrics-recording-only")
+    chrome_options.add_argument("--mute-audio")
+    
+    # Images and stylesheets are blocked at the network layer via CDP (see _BLOCK_PATTERNS)
+    prefs = {
+        "profile.default_content_setting_values.notifications": 2,
+        "profile.managed_default_content_settings.javascript": 1,  # Keep JS for dynamic content
+        "profile.managed_default_content_settings.plugins": 2,
+        "profile.managed_default_content_settings.popups": 2,
+        "profile.managed_default_content_settings.geolocation": 2,
+        "profile.managed_default_content_settings.media_stream": 2,
+    }
+    chrome_options.add_experimental_option("prefs", prefs)
+    
+    # Additional performance options
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-plugins")
+    
+    # Memory and CPU optimizations
+    chrome_options.add_argument("--memory-pressure-off")
+    chrome_options.add_argument("--max_old_space_size=4096")
+    chrome_options.add_argument("--aggressive-cache-discard")
+    
+    # User agent
+    chrome_options.add_argument(f"--user-agent={user_agent}")
+    
+    # Automation flags
+    chrome_options.add_experimental_option("useAutomationExtension", False)
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    
+    # Page load strategy
+    chrome_options.page_load_strategy = 'eager'  # Don't wait for all resources
+    
+    return chrome_options
+
+
+def _build_chrome_options(headless: bool):
+    """Fresh Chrome options for a new driver, copied from the cached prototype for the current settings"""
+    return copy.deepcopy(_options_prototype(
+        headless,
+        # CRAWLER_SINGLE_PROCESS=0 restores the multi-process model where single-process mode is unstable (e.g. some GPUs)
+        os.getenv('CRAWLER_SINGLE_PROCESS', '1') == '1',
+        # Set user agent from environment
+        os.getenv('USER_AGENT', 'ResearchCrawler/2.0 (Educational Purpose; Selenium)'),
+    ))
+
+
+class _DriverPool:
+    """
+    Process-wide pool of idle Chrome drivers. A closed WebDriverManager parks its
+    browser here, wiped of cookies, cache, site storage and tabs, so the next manager
+    can skip Chrome startup without inheriting state. Idle drivers are quit at interpreter exit.
+    """
+    
+    # DRIVER_POOL_SIZE=0 disables pooling
+    max_idle = min(int(os.getenv('DRIVER_POOL_SIZE', 4)), os.cpu_count() or 1)
+    _idle: Dict[bool, List['webdriver.Chrome']] = {}  # headless flag -> idle drivers
+    _lock = threading.Lock()
+    _closed = False
+    
+    @classmethod
+    def acquire(cls, headless: bool) -> Optional['webdriver.Chrome']:
+        """Take a live idle driver with the given headless mode, or None if there isn't one"""
+        while True:
+            with cls._lock:
+                idle = cls._idle.get(headless)
+                if not idle:
+                    return None
+                driver = idle.pop()
+            
+            try:
+                _ = driver.current_url
+                return driver
+            except Exception:
+                cls.discard(driver)
+    
+    @classmethod
+    def release(cls, driver: 'webdriver.Chrome', headless: bool, origins: Iterable[str] = ()) -> bool:
+        """
+        Reset a driver and park it for reuse. origins are the sites it visited, whose storage is
+        cleared. Returns False if it wasn't kept (or couldn't be fully reset); the caller then quits it
+        """
+        with cls._lock:
+            if cls._closed or sum(len(idle) for idle in cls._idle.values()) >= cls.max_idle:
+                return False
+        
+        try:
+            cls._reset(driver, origins)
+        except Exception:
+            return False
+        
+        with cls._lock:
+            if cls._closed:
+                return False
+            cls._idle.setdefault(headless, []).append(driver)
+            return True
+    
+    @staticmethod
+    def _reset(driver: 'webdriver.Chrome', origins: Iterable[str]):
+        """Wipe everything a browsing session leaves behind, so the next checkout starts clean"""
+        # localStorage, IndexedDB, service workers, cache storage, ... of every visited site
+        # (plus the page still open, which may be a redirect target)
+        for origin in {*origins, _origin(driver.current_url)} - {None}:
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'})
+        driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        
+        # sessionStorage and history live in the tab itself, so swap every open tab for a fresh blank one
+        stale_tabs = driver.window_handles
+        driver.switch_to.new_window('tab')
+        fresh_tab = driver.current_window_handle
+        for handle in stale_tabs:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(fresh_tab)
+        _configure_tab(driver, logging.getLogger(__name__))
+    
+    @classmethod
+    def shutdown(cls):
+        """Quit every idle driver and stop accepting new ones"""
+        with cls._lock:
+            cls._closed = True
+            drivers = [driver for idle in cls._idle.values() for driver in idle]
+            cls._idle.clear()
+        
+        for driver in drivers:
+            cls.discard(driver)
+    
+    @staticmethod
+    def discard(driver: 'webdriver.Chrome'):
+        """Quit a driver, ignoring errors from an already dead browser"""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+atexit.register(_DriverPool.shutdown)
+
+
 class WebDriverManager:
     """Manages Chrome WebDriver instances with robust error handling"""
     
-    def __init__(self, headless: bool = True, timeout: int = 10):
+    def __init__(self, headless: bool = True, timeout: int = 10, http_first: bool = False):
         self.headless = headless
         self.timeout = timeout
-        self.driver: Optional[webdriver.Chrome] = None
+        self.driver: Optional['webdriver.Chrome'] = None
         self.logger = logging.getLogger(__name__)
-    
-    def _find_chrome_binary(self) -> Optional[str]:
-        """Find Chrome binary in deployment environments"""
-        # Updated Chrome binary locations for current Streamlit Cloud
-        chrome_paths = [
-            '/usr/bin/chromium',          # Current Streamlit Cloud
-            '/usr/bin/chromium-browser',  # Legacy Streamlit Cloud
-            '/usr/bin/google-chrome',     # If google-chrome-stable works
-            '/usr/bin/google-chrome-stable',
-            '/opt/google/chrome/chrome',
-            '/opt/google/chrome/google-chrome',
-            '/snap/bin/chromium',         # Snap packages
-            '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',  # macOS
-            '/usr/local/bin/google-chrome',
-            '/usr/local/bin/chromium'
-        ]
         
-        for path in chrome_paths:
-            if os.path.exists(path):
-                self.logger.info(f"Found Chrome binary: {path}")
-                return path
+        # Opt-in: serve static pages over plain HTTP and start Chrome only for JavaScript-rendered ones
+        self.http_first = http_first
+        self._http_session = None
+        self._fast_page: Optional[Tuple[str, str]] = None  # (html, final_url) of the last fast-path load
         
-        # Try which command (prioritize new package names)
-        try:
-            import subprocess
-            for cmd in ['chromium', 'chromium-browser', 'google-chrome', 'google-chrome-stable']:
-                result = subprocess.run(['which', cmd], capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    chrome_path = result.stdout.strip()
-                    self.logger.info(f"Found Chrome via which: {chrome_path}")
-                    return chrome_path
-        except Exception:
-            pass
+        # Restart bookkeeping for crash-loop backoff
+        self.restart_backoff = float(os.getenv('DRIVER_RESTART_BACKOFF', 0.5))
+        self._last_restart = 0.0
+        self._consecutive_restarts = 0
         
-        self.logger.warning("Chrome binary not found")
-        return None
+        # When the browser last answered a command; is_alive skips its probe while this is recent
+        self._last_ok_ts = 0.0
+        
+        # Sites this manager's browser visited; their storage is wiped before the browser is pooled
+        self._visited_origins: Set[str] = set()
+    
+    def _find_chrome_binary(self) -> Optional[str]:
+        """Find Chrome binary in deployment environments"""
+        return _find_chrome_binary()
     
     def setup_driver(self) -> bool:
         """Setup Chrome WebDriver with optimized configurations"""
+        # Reuse a warm browser parked by an earlier manager before launching a new one
+        driver = _DriverPool.acquire(self.headless)
+        if driver is not None:
+            try:
+                driver.set_page_load_timeout(self.timeout)
+                self.driver = driver
+                self._last_ok_ts = time.monotonic()
+                self.logger.info("♻️ Reusing pooled Chrome WebDriver")
+                return True
+            except Exception as e:
+                self.logger.debug(f"Discarding pooled WebDriver: {e}")
+                _DriverPool.discard(driver)
+        
         try:
-            chrome_options = Options()
-            
-            # Find Chrome binary for deployment environments
-            chrome_binary = self._find_chrome_binary()
-            if chrome_binary:
-                chrome_options.binary_location = chrome_binary
-            
-            # Basic options
-            if self.headless:
-                chrome_options.add_argument("--headless")
-            
-            # Essential deployment options (optimized for Chromium)
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--disable-web-security")
-            chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-            chrome_options.add_argument("--remote-debugging-port=9222")
-            chrome_options.add_argument("--single-process")
-            chrome_options.add_argument("--disable-background-timer-throttling")
-            chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-            chrome_options.add_argument("--disable-renderer-backgrounding")
-            
-            # Additional Chromium compatibility options
-            chrome_options.add_argument("--disable-setuid-sandbox")
-            chrome_options.add_argument("--disable-software-rasterizer")
-            chrome_options.add_argument("--disable-background-networking")
-            chrome_options.add_argument("--disable-default-apps")
-            chrome_options.add_argument("--disable-sync")
-            chrome_options.add_argument("--no-first-run")
-            chrome_options.add_argument("--no-default-browser-check")
-            
-            # Disable loading of images, CSS, and JavaScript for faster crawling
-            prefs = {
-                "profile.managed_default_content_settings.images": 2,
-                "profile.default_content_setting_values.notifications": 2,
-                "profile.managed_default_content_settings.stylesheets": 2,
-                "profile.managed_default_content_settings.javascript": 1,  # Keep JS for dynamic content
-                "profile.managed_default_content_settings.plugins": 2,
-                "profile.managed_default_content_settings.popups": 2,
-                "profile.managed_default_content_settings.geolocation": 2,
-                "profile.managed_default_content_settings.media_stream": 2,
-            }
-            chrome_options.add_experimental_option("prefs", prefs)
-            
-            # Additional performance options
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--disable-plugins")
-            chrome_options.add_argument("--disable-background-timer-throttling")
-            chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-            chrome_options.add_argument("--disable-renderer-backgrounding")
-            chrome_options.add_argument("--disable-features=TranslateUI")
-            chrome_options.add_argument("--disable-default-apps")
-            
-            # Memory and CPU optimizations
-            chrome_options.add_argument("--memory-pressure-off")
-            chrome_options.add_argument("--max_old_space_size=4096")
-            chrome_options.add_argument("--aggressive-cache-discard")
-            
-            # User agent
-            # Set user agent from environment
-            user_agent = os.getenv('USER_AGENT', 'ResearchCrawler/2.0 (Educational Purpose; Selenium)')
-            chrome_options.add_argument(f"--user-agent={user_agent}")
-            
-            # Automation flags
-            chrome_options.add_experimental_option("useAutomationExtension", False)
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            
-            # Page load strategy
-            chrome_options.page_load_strategy = 'eager'  # Don't wait for all resources
-            
-            # Setup service
-            service = Service(ChromeDriverManager().install())
+            from selenium.common.exceptions import SessionNotCreatedException
+        except ImportError as e:
+            self.logger.error(f"❌ Selenium is not available: {e}")
+            return False
+        
+        try:
+            chrome_options = _build_chrome_options(self.headless)
             
             # Create driver
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            self.driver = _launch_chrome(chrome_options)
+            _configure_tab(self.driver, self.logger)
             
-            # Set timeouts
+            # Set timeouts; no implicit wait, get_page waits explicitly on document readiness
             self.driver.set_page_load_timeout(self.timeout)
-            self.driver.implicitly_wait(5)
-            
-            # Execute script to remove automation detection
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
+            self._last_ok_ts = time.monotonic()
             self.logger.info("✅ Chrome WebDriver initialized successfully")
             return True
             
@@ -167,23 +459,79 @@ class WebDriverManager:
             self.logger.error(f"❌ Failed to setup WebDriver: {e}")
             return False
     
+    async def async_setup(self) -> bool:
+        """Run setup_driver in a worker thread so Chrome startup doesn't block the event loop"""
+        return await asyncio.to_thread(self.setup_driver)
+    
+    def _get_http_session(self):
+        """Lazily build the requests session used by the plain-HTTP fast path"""
+        if self._http_session is None:
+            import requests
+            self._http_session = requests.Session()
+            user_agent = os.getenv('USER_AGENT', 'ResearchCrawler/2.0 (Educational Purpose; Selenium)')
+            self._http_session.headers.update({'User-Agent': user_agent})
+        return self._http_session
+    
+    def _fetch_fast(self, url: str):
+        """GET a URL over plain HTTP, returning the response or None on failure"""
+        try:
+            return self._get_http_session().get(url, timeout=self.timeout, allow_redirects=True)
+        except Exception as e:
+            self.logger.debug(f"Plain HTTP fetch failed for {url}: {e}")
+            return None
+    
+    def get_page_fast(self, url: str) -> Tuple[int, str]:
+        """Fetch a page over plain HTTP without a browser. Returns (status, text); (0, "") on failure"""
+        response = self._fetch_fast(url)
+        if response is None:
+            return 0, ""
+        return response.status_code, response.text
+    
+    async def get_pages_fast(self, urls: List[str]) -> List[Tuple[int, str]]:
+        """Fetch many pages over plain HTTP concurrently, returning (status, text) in input order"""
+        semaphore = asyncio.Semaphore(_FAST_FETCH_CONCURRENCY)
+        
+        async def _one(url: str) -> Tuple[int, str]:
+            async with semaphore:
+                return await asyncio.to_thread(self.get_page_fast, url)
+        
+        return await asyncio.gather(*[_one(url) for url in urls])
+    
     def get_page(self, url: str, wait_for_element: str = "body") -> bool:
         """Navigate to a page and wait for it to load"""
-        if not self.driver:
+        self._fast_page = None
+        
+        # Serve static pages without a browser round trip
+        if self.http_first:
+            response = self._fetch_fast(url)
+            if response is not None and response.status_code == 200 and not _looks_client_rendered(response.text):
+                self.logger.debug(f"⚡ Loaded over plain HTTP: {url}")
+                self._fast_page = (response.text, response.url)
+                return True
+        
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+        
+        # Chrome is started on the first page that actually needs it
+        if not self.driver and not self.setup_driver():
             self.logger.error("WebDriver not initialized")
             return False
         
         try:
             self.logger.debug(f"🌐 Navigating to: {url}")
+            origin = _origin(url)
+            if origin:
+                self._visited_origins.add(origin)
             self.driver.get(url)
             
-            # Wait for page to load
-            wait = WebDriverWait(self.driver, self.timeout)
-            wait.until(EC.presence_of_element_located((By.TAG_NAME, wait_for_element)))
-            
-            # Additional wait for dynamic content
-            time.sleep(1)
+            # Wait for DOMContentLoaded in one round trip; poll only if that didn't settle it
+            condition = _ready_condition(wait_for_element)
+            if condition is not None and not self._await_ready(condition):
+                script = _READY_SCRIPT.format(condition=condition)
+                wait = WebDriverWait(self.driver, self.timeout, poll_frequency=0.1)
+                wait.until(lambda driver: driver.execute_script(script))
             
+            self._last_ok_ts = time.monotonic()
             return True
             
         except TimeoutException:
@@ -196,8 +544,28 @@ class WebDriverManager:
             self.logger.error(f"❌ Error loading {url}: {e}")
             return False
     
+    def _await_ready(self, condition: str) -> bool:
+        """Block on a single CDP call until the document has parsed and condition holds; False if unsure"""
+        expression = _READY_PROMISE.format(condition=condition, timeout_ms=int(self.timeout * 1000))
+        try:
+            result = self.driver.execute_cdp_cmd('Runtime.evaluate', {
+                'expression': expression,
+                'awaitPromise': True,
+                'returnByValue': True,
+            })
+            return result.get('result', {}).get('value') is True
+        except Exception as e:
+            self.logger.debug(f"CDP readiness wait failed, falling back to polling: {e}")
+            return False
+    
+    def get_pages(self, urls: List[str]) -> List[str]:
+        """Load a batch of URLs on this driver, returning page sources ("" for failures)"""
+        return [self.get_page_source() if self.get_page(url) else "" for url in urls]
+    
     def get_page_source(self) -> str:
         """Get the current page source"""
+        if self._fast_page:
+            return self._fast_page[0]
         if not self.driver:
             return ""
         
@@ -209,6 +577,8 @@ class WebDriverManager:
     
     def get_current_url(self) -> str:
         """Get the current URL"""
+        if self._fast_page:
+            return self._fast_page[1]
         if not self.driver:
             return ""
         
@@ -218,22 +588,38 @@ class WebDriverManager:
             self.logger.error(f"Error getting current URL: {e}")
             return ""
     
-    def close(self):
-        """Close the WebDriver"""
+    def close(self, keep_warm: bool = True):
+        """Close the WebDriver, parking a healthy browser in the shared pool unless keep_warm is False"""
+        self._fast_page = None
         if self.driver:
             try:
-                self.driver.quit()
-                self.logger.info("🔒 WebDriver closed successfully")
+                if keep_warm and _DriverPool.release(self.driver, self.headless, self._visited_origins):
+                    self.logger.info("🔒 WebDriver returned to the pool")
+                else:
+                    self.driver.quit()
+                    self.logger.info("🔒 WebDriver closed successfully")
             except Exception as e:
                 self.logger.error(f"Error closing WebDriver: {e}")
             finally:
                 self.driver = None
+                self._visited_origins.clear()
     
     def restart_driver(self) -> bool:
         """Restart the WebDriver (useful when it becomes unresponsive)"""
         self.logger.info("🔄 Restarting WebDriver...")
-        self.close()
-        time.sleep(2)
+        # An unresponsive browser must not be handed to another manager
+        self.close(keep_warm=False)
+        
+        # Only wait when restarts come in quick succession; an isolated restart goes straight through
+        if self._last_restart and time.monotonic() - self._last_restart < _RESTART_COOLDOWN:
+            delay = _backoff_delay(self._consecutive_restarts, base=self.restart_backoff)
+            self._consecutive_restarts += 1
+            self.logger.info(f"⏳ Repeated restart, backing off {delay:.1f}s")
+            time.sleep(delay)
+        else:
+            self._consecutive_restarts = 0
+        
+        self._last_restart = time.monotonic()
         return self.setup_driver()
     
     def is_alive(self) -> bool:
@@ -241,16 +627,27 @@ class WebDriverManager:
         if not self.driver:
             return False
         
+        # A dead chromedriver process is detected without a round trip
+        process = getattr(getattr(self.driver, 'service', None), 'process', None)
+        if process is not None and process.poll() is not None:
+            return False
+        
+        # The browser answered recently, so don't pay a command round trip to ask again
+        if time.monotonic() - self._last_ok_ts < _ALIVE_PROBE_INTERVAL:
+            return True
+        
         try:
             # Try to get current URL to test responsiveness
             _ = self.driver.current_url
+            self._last_ok_ts = time.monotonic()
             return True
         except Exception:
             return False
     
     def __enter__(self):
         """Context manager entry"""
-        if self.setup_driver():
+        # Reuse an already running driver rather than paying Chrome startup again
+        if self.is_alive() or self.setup_driver():
             return self
         else:
             raise RuntimeError("Failed to initialize WebDriver")
@@ -260,9 +657,74 @@ class WebDriverManager:
         self.close()
 
 
-def create_driver_manager(headless: bool = True, timeout: int = 10) -> WebDriverManager:
+class SeleniumPool:
+    """Pool of pre-warmed WebDriverManagers for loading several pages in parallel"""
+    
+    def __init__(self, workers: int = 4, headless: bool = True, timeout: int = 10):
+        self.logger = logging.getLogger(__name__)
+        
+        # Chrome cold starts are mostly disk/IPC bound, so start all drivers concurrently
+        managers = [WebDriverManager(headless=headless, timeout=timeout) for _ in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            started = list(executor.map(WebDriverManager.setup_driver, managers))
+        
+        self._managers: List[WebDriverManager] = [m for m, ok in zip(managers, started) if ok]
+        
+        if not self._managers:
+            raise RuntimeError("Failed to initialize any WebDriver for the pool")
+        
+        self.logger.info(f"🏊 Selenium pool ready with {len(self._managers)}/{workers} drivers")
+        
+        # Idle managers; each WebDriver is used by one thread at a time
+        self._idle: queue.Queue = queue.Queue()
+        for manager in self._managers:
+            self._idle.put(manager)
+    
+    @classmethod
+    async def create(cls, workers: int = 4, headless: bool = True, timeout: int = 10) -> 'SeleniumPool':
+        """Build a pool from async code without blocking the event loop during Chrome startup"""
+        return await asyncio.to_thread(cls, workers, headless, timeout)
+    
+    @property
+    def size(self) -> int:
+        """Number of live drivers in the pool"""
+        return len(self._managers)
+    
+    def fetch(self, url: str) -> str:
+        """Load a URL on the next idle driver and return its page source ("" on failure)"""
+        manager = self._idle.get()
+        try:
+            return manager.get_page_source() if manager.get_page(url) else ""
+        finally:
+            self._idle.put(manager)
+    
+    async def afetch(self, url: str) -> str:
+        """Async variant of fetch; the page load runs in a worker thread"""
+        return await asyncio.to_thread(self.fetch, url)
+    
+    def fetch_all(self, urls: List[str]) -> List[str]:
+        """Load URLs concurrently across all drivers, returning sources in input order"""
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return list(executor.map(self.fetch, urls))
+    
+    def close(self):
+        """Close every driver in the pool"""
+        for manager in self._managers:
+            manager.close()
+        self._managers.clear()
+    
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
+
+
+def create_driver_manager(headless: bool = True, timeout: int = 10, http_first: bool = False) -> WebDriverManager:
     """Factory function to create a WebDriverManager instance"""
-    return WebDriverManager(headless=headless, timeout=timeout)
+    return WebDriverManager(headless=headless, timeout=timeout, http_first=http_first)
 
 
 def test_driver_setup():
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Test script for the caching utilities (TTL/LRU cache, SQLite cache, memoization and coalescing)
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+sys.path.append('.')
+
+from cache_utils import TTLLRUCache, SQLiteTTLCache, ttl_lru_cache, coalesce_inflight
+
+def test_ttl_expiry():
+    """Entries are served until their TTL passes, then count as misses"""
+    cache = TTLLRUCache(maxsize=4, ttl=0.05)
+    cache.set('a', 1)
+    
+    assert cache.get('a') == 1
+    time.sleep(0.1)
+    assert cache.get('a', 'expired') == 'expired'
+    
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 0)
+
+def test_lru_eviction_order():
+    """A full cache evicts the least recently used entry, and reads count as use"""
+    cache = TTLLRUCache(maxsize=2, ttl=60)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')      # 'b' is now the least recently used
+    cache.set('c', 3)
+    
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    
+    cache.clear()
+    assert cache.info() == (0, 0, 2, 0)
+
+def test_sqlite_cache_persists_across_instances():
+    """Values written by one SQLiteTTLCache are read back by a new instance on the same file"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'nested', 'cache.db')
+        
+        cache = SQLiteTTLCache(path)
+        cache.set('urls', ['https://a.example', 'https://b.example'], expire=60)
+        cache.set('short', 'gone soon', expire=0.05)
+        cache.close()
+        
+        reopened = SQLiteTTLCache(path)
+        try:
+            assert reopened.get('urls') == ['https://a.example', 'https://b.example']
+            time.sleep(0.1)
+            assert reopened.get('short', 'expired') == 'expired'
+            assert reopened.get('missing') is None
+        finally:
+            reopened.close()
+
+def test_ttl_lru_cache_sync():
+    """Sync functions are called once per key; cache_if keeps rejected results out"""
+    calls = []
+    
+    @ttl_lru_cache(maxsize=8, ttl=60, cache_if=lambda value: value is not None)
+    def lookup(key):
+        calls.append(key)
+        return None if key == 'degraded' else key.upper()
+    
+    assert lookup('x') == 'X'
+    assert lookup('x') == 'X'
+    assert lookup('degraded') is None
+    assert lookup('degraded') is None
+    assert calls == ['x', 'degraded', 'degraded']
+    
+    lookup.cache_clear()
+    lookup('x')
+    assert calls[-1] == 'x'
+
+def test_ttl_lru_cache_async():
+    """Async functions cache their awaited result, not the coroutine"""
+    calls = []
+    
+    @ttl_lru_cache(maxsize=8, ttl=60, key=lambda query: query.lower())
+    async def search(query):
+        calls.append(query)
+        await asyncio.sleep(0)
+        return [query.lower()]
+    
+    async def run():
+        first = await search('Python')
+        second = await search('PYTHON')
+        return first, second
+    
+    first, second = asyncio.run(run())
+    assert first == second == ['python']
+    assert calls == ['Python']
+    assert search.cache_info().hits == 1
+
+def test_coalesce_inflight_shares_one_call():
+    """Concurrent calls with the same key share one execution; other keys run separately"""
+    calls = []
+    
+    @coalesce_inflight(key=lambda key: key)
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.05)
+        return key * 2
+    
+    async def run():
+        return await asyncio.gather(fetch('a'), fetch('a'), fetch('a'), fetch('b'))
+    
+    assert asyncio.run(run()) == ['aa', 'aa', 'aa', 'bb']
+    assert calls == ['a', 'b']
+    
+    # Once finished, the key is no longer in flight and a new call runs again
+    asyncio.run(fetch('a'))
+    assert calls == ['a', 'b', 'a']
+
+def test_coalesce_inflight_propagates_errors():
+    """A failure reaches every waiter and is not remembered for later calls"""
+    calls = []
+    
+    @coalesce_inflight(key=lambda key: key)
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.05)
+        if len(calls) == 1:
+            raise ValueError("upstream failed")
+        return key
+    
+    async def run():
+        return await asyncio.gather(fetch('a'), fetch('a'), return_exceptions=True)
+    
+    results = asyncio.run(run())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert asyncio.run(fetch('a')) == 'a'
+    assert calls == ['a', 'a']
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Cache Utilities")
+    print("=" * 50)
+    
+    tests = [
+        test_ttl_expiry,
+        test_lru_eviction_order,
+        test_sqlite_cache_persists_across_instances,
+        test_ttl_lru_cache_sync,
+        test_ttl_lru_cache_async,
+        test_coalesce_inflight_shares_one_call,
+        test_coalesce_inflight_propagates_errors,
+    ]
+    
+    success = True
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            print(f"❌ {test.__name__}: {e!r}")
+            success = False
+    
+    print("\n" + "=" * 50)
+    if success:
+        print("🎉 ALL CACHE TESTS PASSED!")
+    else:
+        print("❌ SOME CACHE TESTS FAILED!")
+    
+    return success
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
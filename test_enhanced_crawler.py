@@ -4,8 +4,11 @@ Test script for the enhanced Graph Web Crawler with Selenium and proper graph st
 """
 
 import logging
+import logging.handlers
 import sys
 import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 # Add the project directory to Python path
@@ -27,6 +30,10 @@ def setup_logging():
         ]
     )
 
+def setup_worker_logging(log_queue):
+    """Send a worker process's log records to the parent, which alone writes test_crawler.log"""
+    logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(log_queue)])
+
 def test_selenium_setup():
     """Test Selenium WebDriver setup"""
     print("🧪 Testing Selenium WebDriver setup...")
@@ -148,6 +155,11 @@ def test_research_service():
         traceback.print_exc()
         return False
 
+def _run_test(test_name, test_func) -> bool:
+    """Run one test in a worker process"""
+    print(f"\n{'=' * 20} {test_name} {'=' * 20}")
+    return bool(test_func())
+
 def run_all_tests():
     """Run all tests"""
     print("🚀 Starting Graph Web Crawler Tests")
@@ -164,16 +176,33 @@ def run_all_tests():
     
     results = {}
     
-    for test_name, test_func in tests:
-        print(f"\n{'=' * 20} {test_name} {'=' * 20}")
-        try:
-            result = test_func()
-            results[test_name] = result
-            status = "✅ PASSED" if result else "❌ FAILED"
-            print(f"{status}: {test_name}")
-        except Exception as e:
-            results[test_name] = False
-            print(f"❌ FAILED: {test_name} - {e}")
+    # Each test builds its own crawler/driver, so they run side by side in separate
+    # processes (WebDriver instances aren't thread-safe). spawn keeps macOS happy.
+    # Workers queue their log records to this process, so only one writer touches the log file
+    context = multiprocessing.get_context('spawn')
+    log_queue = context.Queue()
+    listener = logging.handlers.QueueListener(log_queue, *logging.getLogger().handlers, respect_handler_level=True)
+    listener.start()
+    
+    workers = min(len(tests), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=setup_worker_logging, initargs=(log_queue,)) as executor:
+        futures = {executor.submit(_run_test, test_name, test_func): test_name for test_name, test_func in tests}
+        for future in as_completed(futures):
+            test_name = futures[future]
+            try:
+                result = future.result()
+                results[test_name] = result
+                status = "✅ PASSED" if result else "❌ FAILED"
+                print(f"{status}: {test_name}")
+            except Exception as e:
+                results[test_name] = False
+                print(f"❌ FAILED: {test_name} - {e}")
+    
+    listener.stop()
+    
+    # Report in the declared order rather than completion order
+    results = {test_name: results[test_name] for test_name, _ in tests}
     
     # Summary
     print("\n" + "=" * 50)
@@ -4,141 +4,223 @@ Test script to verify environment variables are properly loaded and used
 """
 
 import os
+import re
 import sys
+import atexit
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
 
 # Add project directory to path
 project_dir = Path(__file__).parent
 sys.path.insert(0, str(project_dir))
 
-def test_environment_variables():
-    """Test if environment variables are properly loaded"""
-    print("🧪 Testing Environment Variable Loading")
-    print("=" * 50)
+# An unquoted value ends where whitespace followed by '#' starts a comment
+_INLINE_COMMENT_RE = re.compile(r'\s+#')
+
+def _parse_env(content):
+    """
+    Parse .env lines the way python-dotenv does for plain files: comments, blank lines and a
+    leading 'export' are skipped, quoted values are unquoted, and unquoted values lose ' # ...' comments
+    """
+    values = {}
+    for line in content.decode('utf-8-sig').splitlines():
+        line = line.strip()
+        if line.startswith('export '):
+            line = line[len('export '):].lstrip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        key, value = line.split('=', 1)
+        value = value.strip()
+        if value[:1] in ('"', "'") and value.find(value[0], 1) != -1:
+            value = value[1:value.find(value[0], 1)]
+        else:
+            value = _INLINE_COMMENT_RE.split(value, 1)[0]
+        values[key.strip()] = value
+    return values
+
+def _load_env(env_path=project_dir / '.env'):
+    """Load .env into os.environ; variables already set in the environment win"""
+    try:
+        content = env_path.read_bytes()
+    except OSError:
+        return
     
-    # Load environment variables
-    load_dotenv()
+    for key, value in _parse_env(content).items():
+        os.environ.setdefault(key, value)
+
+# Load environment variables once and snapshot them; every test reads from this dict.
+# A re-import in the same interpreter (e.g. under pytest) skips loading .env again
+if not os.environ.get('_DOTENV_LOADED'):
+    _load_env()
+    os.environ['_DOTENV_LOADED'] = '1'
+_ENV = dict(os.environ)
+
+# Environment variables under test, with the defaults the app falls back to
+_ENV_DEFAULTS = {
+    'DEFAULT_DELAY': 1.0,
+    'DEFAULT_TIMEOUT': 10,
+    'MAX_PAGES_PER_CRAWL': 50,
+    'SEARCH_MAX_DEPTH': 1,
+    'SEARCH_MAX_PAGES': 25,
+    'SEARCH_MAX_LINKS_PER_PAGE': 5,
+    'SEARCH_DELAY_MULTIPLIER': 0.7,
+    'DEEP_BFS_PAGES': 20,
+    'DEEP_DFS_DEPTH': 4,
+    'DEEP_MAX_LINKS_BFS': 8,
+    'DEEP_MAX_LINKS_DFS': 6,
+    'DEEP_DELAY_MULTIPLIER': 1.0,
+    'USER_AGENT': 'ResearchCrawler/1.0 (Educational Purpose)'
+}
+
+# (name, converter, default) resolved once instead of on every lookup
+_SPEC = [(name, type(default), default) for name, default in _ENV_DEFAULTS.items()]
+
+# Report line for one variable: name, value, type name
+_LINE_TMPL = "   {}: {} (Type: {})".format
+
+def _resolve(name, converter, default):
+    """Value of name from the environment snapshot, or default if it is unset or doesn't convert"""
+    raw = _ENV.get(name)
+    if raw is None:
+        return default
+    try:
+        return converter(raw)
+    except (ValueError, TypeError):
+        return default
+
+@functools.lru_cache(maxsize=None)
+def _env_int(name, default):
+    """Integer setting from the environment snapshot; parsed once per name"""
+    raw = _ENV.get(name)
+    return default if raw is None else int(raw)
+
+@functools.lru_cache(maxsize=1)
+def _get_service():
+    """Shared ResearchService for every test; its driver is cleaned up once at exit"""
+    from research_service import ResearchService
     
-    # Test all environment variables
-    env_vars = {
-        'DEFAULT_DELAY': 1.0,
-        'DEFAULT_TIMEOUT': 10,
-        'MAX_PAGES_PER_CRAWL': 50,
-        'SEARCH_MAX_DEPTH': 1,
-        'SEARCH_MAX_PAGES': 25,
-        'SEARCH_MAX_LINKS_PER_PAGE': 5,
-        'SEARCH_DELAY_MULTIPLIER': 0.7,
-        'DEEP_BFS_PAGES': 20,
-        'DEEP_DFS_DEPTH': 4,
-        'DEEP_MAX_LINKS_BFS': 8,
-        'DEEP_MAX_LINKS_DFS': 6,
-        'DEEP_DELAY_MULTIPLIER': 1.0,
-        'USER_AGENT': 'ResearchCrawler/1.0 (Educational Purpose)'
-    }
+    service = ResearchService()
+    atexit.register(service.cleanup)
+    return service
+
+def _report(lines, passed):
+    """Log a test's report as one record: INFO when it passed, ERROR when it failed"""
+    logger.log(logging.INFO if passed else logging.ERROR, "\n".join(lines))
+
+def test_environment_variables():
+    """Test if environment variables are properly loaded"""
+    # Report lines are collected and written once, so concurrent tests don't interleave
+    lines = ["🧪 Testing Environment Variable Loading", "=" * 50]
     
-    print("📋 Environment Variables:")
-    for var_name, default_value in env_vars.items():
-        if isinstance(default_value, str):
-            value = os.getenv(var_name, default_value)
-        else:
-            try:
-                value = type(default_value)(os.getenv(var_name, str(default_value)))
-            except (ValueError, TypeError):
-                value = default_value
-        
-        print(f"   {var_name}: {value} (Type: {type(value).__name__})")
+    lines.append("📋 Environment Variables:")
+    resolved = {spec[0]: _resolve(*spec) for spec in _SPEC}
+    lines.extend(_LINE_TMPL(name, value, type(value).__name__) for name, value in resolved.items())
     
-    print("\n✅ Environment variables loaded successfully!")
+    lines.append("\n✅ Environment variables loaded successfully!")
+    _report(lines, True)
     
     return True
 
 def test_research_service_config():
     """Test ResearchService configuration with environment variables"""
-    print("\n🧪 Testing ResearchService Configuration")
-    print("=" * 50)
+    lines = ["\n🧪 Testing ResearchService Configuration", "=" * 50]
+    passed = False
     
     try:
-        from research_service import ResearchService
-        
         # Create service (should use environment variables)
-        service = ResearchService()
+        service = _get_service()
         
-        print("✅ ResearchService created successfully")
-        print(f"   Crawler delay: {service.crawler.delay}")
-        print(f"   Crawler timeout: {service.crawler.timeout}")
-        print(f"   Crawler max_pages: {service.crawler.max_pages}")
+        lines.append("✅ ResearchService created successfully")
+        lines.append(f"   Crawler delay: {service.crawler.delay}")
+        lines.append(f"   Crawler timeout: {service.crawler.timeout}")
+        lines.append(f"   Crawler max_pages: {service.crawler.max_pages}")
         
         # Test environment variable retrieval
-        search_max_depth = int(os.getenv('SEARCH_MAX_DEPTH', 1))
-        search_max_pages = int(os.getenv('SEARCH_MAX_PAGES', 25))
-        deep_bfs_pages = int(os.getenv('DEEP_BFS_PAGES', 20))
-        deep_dfs_depth = int(os.getenv('DEEP_DFS_DEPTH', 4))
+        search_max_depth = _env_int('SEARCH_MAX_DEPTH', 1)
+        search_max_pages = _env_int('SEARCH_MAX_PAGES', 25)
+        deep_bfs_pages = _env_int('DEEP_BFS_PAGES', 20)
+        deep_dfs_depth = _env_int('DEEP_DFS_DEPTH', 4)
         
-        print(f"\n📊 Algorithm Configuration:")
-        print(f"   Search - Max Depth: {search_max_depth}")
-        print(f"   Search - Max Pages: {search_max_pages}")
-        print(f"   Deep - BFS Pages: {deep_bfs_pages}")
-        print(f"   Deep - DFS Depth: {deep_dfs_depth}")
-        
-        # Cleanup
-        service.cleanup()
+        lines.append(f"\n📊 Algorithm Configuration:")
+        lines.append(f"   Search - Max Depth: {search_max_depth}")
+        lines.append(f"   Search - Max Pages: {search_max_pages}")
+        lines.append(f"   Deep - BFS Pages: {deep_bfs_pages}")
+        lines.append(f"   Deep - DFS Depth: {deep_dfs_depth}")
         
+        passed = True
         return True
         
     except Exception as e:
-        print(f"❌ ResearchService test failed: {e}")
+        lines.append(f"❌ ResearchService test failed: {e}")
         return False
+    
+    finally:
+        _report(lines, passed)
 
 def test_graph_crawler_env_usage():
     """Test GraphWebCrawler environment variable usage"""
-    print("\n🧪 Testing GraphWebCrawler Environment Usage")
-    print("=" * 50)
+    lines = ["\n🧪 Testing GraphWebCrawler Environment Usage", "=" * 50]
+    passed = False
     
     try:
         from graph_crawler import GraphWebCrawler
         
         # Test environment variable access
-        search_max_links = int(os.getenv('SEARCH_MAX_LINKS_PER_PAGE', 5))
-        deep_max_links_bfs = int(os.getenv('DEEP_MAX_LINKS_BFS', 8))
-        deep_max_links_dfs = int(os.getenv('DEEP_MAX_LINKS_DFS', 6))
+        search_max_links = _env_int('SEARCH_MAX_LINKS_PER_PAGE', 5)
+        deep_max_links_bfs = _env_int('DEEP_MAX_LINKS_BFS', 8)
+        deep_max_links_dfs = _env_int('DEEP_MAX_LINKS_DFS', 6)
         
-        print(f"📊 Link Limits from Environment:")
-        print(f"   Search max links per page: {search_max_links}")
-        print(f"   Deep BFS max links: {deep_max_links_bfs}")
-        print(f"   Deep DFS max links: {deep_max_links_dfs}")
+        lines.append(f"📊 Link Limits from Environment:")
+        lines.append(f"   Search max links per page: {search_max_links}")
+        lines.append(f"   Deep BFS max links: {deep_max_links_bfs}")
+        lines.append(f"   Deep DFS max links: {deep_max_links_dfs}")
         
-        # Create crawler instance
+        # Create crawler instance; Chrome is only started on first use, so this is config-only
         crawler = GraphWebCrawler(delay=0.5, timeout=5, max_pages=3, headless=True)
-        print("✅ GraphWebCrawler created successfully")
+        if crawler.driver_manager.driver is not None:
+            lines.append("❌ GraphWebCrawler started a browser during construction")
+            crawler.close_driver()
+            return False
+        lines.append("✅ GraphWebCrawler created successfully")
+        
+        # Launch a real browser only when asked for (FULL_TEST=1)
+        if _ENV.get('FULL_TEST') == '1':
+            if not crawler._ensure_driver():
+                lines.append("❌ WebDriver failed to start")
+                return False
+            lines.append("✅ WebDriver started successfully")
         
         # Cleanup
         crawler.close_driver()
         
+        passed = True
         return True
         
     except Exception as e:
-        print(f"❌ GraphWebCrawler test failed: {e}")
+        lines.append(f"❌ GraphWebCrawler test failed: {e}")
         return False
+    
+    finally:
+        _report(lines, passed)
 
 def main():
     """Main test function"""
-    print("🔬 Environment Variables and Configuration Test")
-    print("=" * 60)
-    
-    success = True
-    
-    # Test 1: Environment variables
-    if not test_environment_variables():
-        success = False
+    logger.info("🔬 Environment Variables and Configuration Test\n" + "=" * 60)
     
-    # Test 2: ResearchService configuration
-    if not test_research_service_config():
-        success = False
+    # The tests are independent and mostly wait on browser startup, so run them side by side
+    tests = (
+        test_environment_variables,     # Test 1: Environment variables
+        test_research_service_config,   # Test 2: ResearchService configuration
+        test_graph_crawler_env_usage,   # Test 3: GraphWebCrawler environment usage
+    )
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        results = list(executor.map(lambda test: test(), tests))
     
-    # Test 3: GraphWebCrawler environment usage
-    if not test_graph_crawler_env_usage():
-        success = False
+    success = all(results)
     
     # Final result
     print("\n" + "=" * 60)
@@ -150,5 +232,9 @@ def main():
     return success
 
 if __name__ == "__main__":
+    # Per-test reports are INFO records: quiet by default, LOG_LEVEL=INFO shows them; failures always show
+    logging.basicConfig(level=(_ENV.get('LOG_LEVEL') or 'WARNING').upper(), format='%(message)s', stream=sys.stdout)
+    # Reports are written in whole blocks; block-buffer them even on a terminal
+    sys.stdout.reconfigure(line_buffering=False)
     success = main()
     sys.exit(0 if success else 1)
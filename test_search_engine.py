@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test script for SearchEngine's sync and async entry points (no network: search results are stubbed)
+"""
+
+import asyncio
+import os
+import sys
+sys.path.append('.')
+
+# Keep the test offline and independent of earlier runs
+os.environ['SEARCH_WARMUP'] = 'false'
+os.environ['SEARCH_DISK_CACHE_TTL'] = '0'
+
+from search_engine import SearchEngine
+
+def _stubbed_engine(results):
+    """SearchEngine whose live search returns results without touching the network"""
+    engine = SearchEngine()
+    
+    async def _fake_search(query):
+        return list(results)
+    
+    engine._get_actual_search_results = _fake_search
+    return engine
+
+def test_get_search_urls_without_loop():
+    """The sync entry point works from plain synchronous code"""
+    engine = _stubbed_engine(['https://example.com/sync-result'])
+    urls = engine.get_search_urls('sync entry point check')
+    assert urls[0] == 'https://example.com/sync-result'
+
+def test_get_search_urls_inside_running_loop():
+    """The sync entry point also works when called from code that already runs an event loop"""
+    engine = _stubbed_engine(['https://example.com/loop-result'])
+    
+    async def caller():
+        return engine.get_search_urls('running loop entry point check')
+    
+    urls = asyncio.run(caller())
+    assert urls[0] == 'https://example.com/loop-result'
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Search Engine Entry Points")
+    print("=" * 50)
+    
+    tests = [
+        test_get_search_urls_without_loop,
+        test_get_search_urls_inside_running_loop,
+    ]
+    
+    success = True
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            print(f"❌ {test.__name__}: {e!r}")
+            success = False
+    
+    print("\n" + "=" * 50)
+    if success:
+        print("🎉 ALL SEARCH ENGINE TESTS PASSED!")
+    else:
+        print("❌ SOME SEARCH ENGINE TESTS FAILED!")
+    
+    return success
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)